@@ -93,14 +93,18 @@ def _has_meaningful_value(obj: Optional[Dict[str, Any]], key: str) -> bool:
 
 def _combined_event_text(event: Optional[Dict[str, Any]], device: Optional[Dict[str, Any]]) -> str:
     parts: List[str] = []
+    source = event or {}
     for key in _TYPE_KEYS:
-        value = (event or {}).get(key)
+        value = source.get(key)
         if value is None:
             continue
-        try:
-            text = str(value).strip()
-        except Exception:
-            continue
+        if type(value) is str:
+            text = value.strip()
+        else:
+            try:
+                text = str(value).strip()
+            except Exception:
+                continue
         if text:
             parts.append(text)
 
@@ -133,10 +137,13 @@ def categorize_event(event: Optional[Dict[str, Any]], device: Optional[Dict[str,
             if normalized in {"private pin", "privatepin", "pin", "passcode"}:
                 return "access"
 
-    combined = _combined_event_text(event, device)
+    # Call fields decide the category on their own; only build the combined
+    # text once the cheap key probes have not settled it.
+    if event and any(_has_meaningful_value(event, key) for key in _CALL_KEYS):
+        return "call"
 
-    call_detected = any(_has_meaningful_value(event, key) for key in _CALL_KEYS)
-    if call_detected or _CALL_PATTERN.search(combined):
+    combined = _combined_event_text(event, device)
+    if _CALL_PATTERN.search(combined):
         return "call"
 
     if _SYSTEM_PATTERN.search(combined):
@@ -296,6 +303,11 @@ class AccessHistory:
     def __len__(self) -> int:  # pragma: no cover - convenience only
         return len(self._events)
 
+    def __contains__(self, key: object) -> bool:
+        """Return True when an event with *key* is already stored."""
+
+        return self._coerce_key(key) in self._seen
+
     @staticmethod
     def _normalize_limit(limit: Optional[int]) -> int:
         try:
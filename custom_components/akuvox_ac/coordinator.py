@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict, deque
+import hashlib
 import logging
 import datetime as dt
 from datetime import timedelta
+from functools import lru_cache
 import time
 import re
-from typing import Any, Dict, List, Optional, Tuple, Callable, Awaitable
+import sys
+from operator import itemgetter
+from typing import Any, Container, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple, Callable, Awaitable
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, EVENT_NON_KEY_ACCESS_GRANTED, DEFAULT_ACCESS_HISTORY_LIMIT
 from .ha_id import normalize_ha_id, normalize_user_id
@@ -41,15 +47,173 @@ CALLER_EVENT_WINDOW_SECONDS = 30
 ACCESS_PERMITTED_NOTIFICATION_WINDOW_SECONDS = 10
 NOTIFICATION_DIAGNOSTICS_LIMIT = 200
 USER_LIST_REFRESH_INTERVAL_SECONDS = 300
+EVENT_HISTORY_LIMIT = 1000
+SEEN_EVENT_KEY_LIMIT = 256
+OFFLINE_ALERT_DELAY_SECONDS = 300
+ACTIVE_POLL_INTERVAL_SECONDS = 10
+OFFLINE_POLL_INTERVAL_SECONDS = 300
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-_TIME_ONLY_RE = re.compile(r"^\d{1,2}:\d{2}:\d{2}(?:\.\d+)?$")
+def _is_time_only(text: str) -> bool:
+    """Return True for clock-only values such as ``8:05:01`` or ``08:05:01.250``."""
+
+    clock, dot, fraction = text.partition(".")
+    if dot and not fraction.isdecimal():
+        return False
+    parts = clock.split(":")
+    if len(parts) != 3:
+        return False
+    hours, minutes, seconds = parts
+    return (
+        0 < len(hours) <= 2
+        and len(minutes) == 2
+        and len(seconds) == 2
+        and hours.isdecimal()
+        and minutes.isdecimal()
+        and seconds.isdecimal()
+    )
+
+
+def _keyword_pattern(words: Iterable[str]) -> "re.Pattern[str]":
+    """Compile substring keywords into one alternation scanned in a single pass.
+
+    Keywords that contain a shorter keyword can never change the outcome of a
+    substring search, so they are dropped to keep the alternation minimal.
+    """
+    unique = sorted(set(words), key=len)
+    minimal: List[str] = []
+    for word in unique:
+        if not any(shorter in word for shorter in minimal):
+            minimal.append(word)
+    return re.compile("|".join(re.escape(word) for word in minimal))
+
+
+_ACCESS_DENIED_WORDS = (
+    "denied",
+    "refused",
+    "invalid",
+    "failed",
+    "fail",
+    "error",
+    "unauthorized",
+    "forbidden",
+    "rejected",
+)
+_ACCESS_GRANTED_WORDS = (
+    "grant",
+    "granted",
+    "permit",
+    "permitted",
+    "allowed",
+    "success",
+    "succ",
+    "opened",
+    "open",
+    "unlock",
+    "passed",
+    "access ok",
+)
+_NON_KEY_GRANT_WORDS = (
+    "grant",
+    "granted",
+    "permit",
+    "permitted",
+    "open",
+    "unlock",
+    "success",
+    "allowed",
+)
+_KEY_CREDENTIAL_WORDS = ("card", "rfid", "key", "tag", "fob")
+
+_ACCESS_DENIED_RE = _keyword_pattern(_ACCESS_DENIED_WORDS)
+_ACCESS_GRANTED_RE = _keyword_pattern(_ACCESS_GRANTED_WORDS)
+_NON_KEY_GRANT_RE = _keyword_pattern(_NON_KEY_GRANT_WORDS)
+_KEY_CREDENTIAL_RE = _keyword_pattern(_KEY_CREDENTIAL_WORDS)
+
+
+def _summary_access_verdict(summary: str) -> Optional[str]:
+    """Return ``"denied"``, ``"granted"`` or None for a joined event summary."""
+
+    if not summary:
+        return None
+    if _ACCESS_DENIED_RE.search(summary) is not None:
+        return "denied"
+    if _ACCESS_GRANTED_RE.search(summary) is not None:
+        return "granted"
+    return None
+
+
+_BOOL_WORDS: Dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y", "on"), True),
+    **dict.fromkeys(("0", "false", "f", "no", "n", "off"), False),
+}
+
+_EMPTY_CALLER_STATE: Dict[str, Any] = {
+    "caller_id": None,
+    "caller_name": None,
+    "caller_number": None,
+    "raw_number": None,
+    "digits": None,
+    "call_id": None,
+    "call_type": None,
+    "timestamp": None,
+    "age_seconds": None,
+    "key_holder": None,
+    "status": None,
+    "error": None,
+    "source": None,
+}
+
+
+class _EventFacts(NamedTuple):
+    """Identity and timing derived once per door event."""
+
+    key: Optional[str]
+    timestamp: Optional[str]
+    epoch: float
+
+
+_UNRESOLVED = object()
+
+
+_EVENT_TIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M:%S")
+
+
+@lru_cache(maxsize=SEEN_EVENT_KEY_LIMIT)
+def _event_text_to_epoch(text: str) -> float:
+    """Parse a device timestamp string to epoch seconds, or 0.0 if unparseable.
+
+    Devices return the same rows on every poll, so results are memoised.
+    """
+
+    parsed = dt_util.parse_datetime(text)
+    if not parsed:
+        normalized = text.replace(" ", "T")
+        parsed = dt_util.parse_datetime(normalized)
+    if not parsed:
+        cleaned = text.replace("T", " ").split("+", 1)[0].split("Z", 1)[0]
+        for fmt in _EVENT_TIME_FORMATS:
+            try:
+                parsed = dt.datetime.strptime(cleaned, fmt)
+                break
+            except Exception:
+                continue
+    if not parsed:
+        return 0.0
+    try:
+        if parsed.tzinfo is None:
+            return parsed.timestamp()
+        return dt_util.as_utc(parsed).timestamp()
+    except Exception:
+        return 0.0
 
 
 def _safe_str(x) -> str:
+    if type(x) is str:
+        return x
     try:
         return str(x)
     except Exception:
@@ -57,8 +221,30 @@ def _safe_str(x) -> str:
 
 
 def _now_iso(hass: HomeAssistant) -> str:
-    from homeassistant.util import dt as dt_util
-    return dt_util.utcnow().isoformat() + "Z"
+    # ``utcnow()`` is timezone-aware, so swap the ``+00:00`` offset for ``Z``
+    # instead of appending a second UTC designator.
+    return dt_util.utcnow().isoformat().replace("+00:00", "Z")
+
+
+def _door_event_watermark(state: Dict[str, Any]) -> Tuple[Optional[str], float]:
+    """Return the ``(key, epoch)`` door event watermark from stored state.
+
+    Older installs kept ``last_event_key``/``last_event_epoch`` as separate
+    entries; they are read here until the next write replaces them.
+    """
+
+    raw = state.get("watermark")
+    if isinstance(raw, (list, tuple)) and len(raw) == 2:
+        key_raw, epoch_raw = raw
+    else:
+        key_raw = state.get("last_event_key")
+        epoch_raw = state.get("last_event_epoch")
+    key = _safe_str(key_raw) if key_raw else None
+    try:
+        epoch = float(epoch_raw)
+    except (TypeError, ValueError):
+        epoch = 0.0
+    return key, epoch
 
 
 def _canonical_notify_user_id(value: Any) -> Optional[str]:
@@ -147,30 +333,90 @@ def _alert_targets_for_event(hass: HomeAssistant, event_type: str, *, user_id: O
 class AkuvoxCoordinator(DataUpdateCoordinator):
     """Polls device, tracks health/events/users, and keeps a stable friendly name."""
 
+    # DataUpdateCoordinator keeps an instance __dict__, so these slots only cover
+    # the per-device fields read on every poll; everything else stays dynamic.
+    __slots__ = (
+        "api",
+        "entry_id",
+        "storage",
+        "device_name",
+        "friendly_name",
+        "health",
+        "users",
+        "_events",
+        "event_state",
+        "caller_state",
+        "_was_online",
+    )
+
+    # Door event field probes, most common Akuvox spelling first.
+    _EVENT_ID_KEYS = ("Index", "ID", "LogID", "LogId", "EventID", "EventId", "SN", "Sn")
+    _EVENT_DESCRIPTION_KEYS = ("Event", "EventType", "Type", "Description")
+    _EVENT_DATE_KEYS = ("DateTime", "datetime", "Date", "date", "EventDate", "LogDate")
+    _EVENT_TIME_KEYS = ("Time", "time", "EventTime", "LogTime", "RecordTime", "timestamp", "Timestamp")
+    _EVENT_TIMESTAMP_KEYS = (
+        "Time",
+        "time",
+        "DateTime",
+        "datetime",
+        "Timestamp",
+        "timestamp",
+        "CreateTime",
+        "RecordTime",
+        "LogTime",
+        "EventTime",
+    )
+    _EVENT_USER_KEYS = ("UserID", "UserId", "User", "UserName", "Name", "CardNo", "CardNumber", "ID")
+    _EVENT_USER_NAME_KEYS = ("Name", "UserName", "User", "UserID", "UserId", "ID", "CardNo", "CardNumber")
+    _EVENT_USER_NAME_KEY_SET = frozenset(_EVENT_USER_NAME_KEYS)
+    _KEY_HOLDER_KEYS = ("key_holder", "KeyHolder", "keyHolder")
+    _EVENT_METHOD_KEYS = (
+        "Event",
+        "EventType",
+        "Type",
+        "OpenMethod",
+        "AccessMethod",
+        "OpenDoorType",
+        "Mode",
+        "Way",
+    )
+    _EVENT_SUMMARY_KEYS = (
+        "Event",
+        "EventType",
+        "Type",
+        "Description",
+        "Reason",
+        "OpenMethod",
+        "AccessMethod",
+        "Mode",
+        "Way",
+    )
+
     def __init__(self, hass: HomeAssistant, api: AkuvoxAPI, storage, entry_id: str, device_name: str):
         # NOTE: DataUpdateCoordinator.name is used by HA logs; keep it technical
-        super().__init__(hass, _LOGGER, name=f"akuvox_ac:{entry_id}", update_interval=timedelta(seconds=30))
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"akuvox_ac:{entry_id}",
+            update_interval=timedelta(seconds=30),
+            always_update=False,
+        )
 
         self.api = api
         self.entry_id = entry_id
         self.storage = storage
-        if "last_access" not in getattr(self.storage, "data", {}):
-            self.storage.data["last_access"] = {}
-        if "door_events" not in self.storage.data:
-            self.storage.data["door_events"] = {}
-        notifications = self.storage.data.get("notifications")
-        if not isinstance(notifications, dict):
-            self.storage.data["notifications"] = {}
-        notification_diagnostics = self.storage.data.get("notification_diagnostics")
-        if not isinstance(notification_diagnostics, list):
-            self.storage.data["notification_diagnostics"] = []
-        alerts_state = self.storage.data.get("alerts_state")
-        if not isinstance(alerts_state, dict):
-            self.storage.data["alerts_state"] = {}
-        self._alerts_state = self.storage.data.get("alerts_state", {})
-        persisted_last_checked = str(
-            self.storage.data.get("last_checked") or ""
-        ).strip() or None
+        storage_data = self.storage.data
+        if not isinstance(storage_data.get("last_access"), dict):
+            storage_data["last_access"] = {}
+        if not isinstance(storage_data.get("door_events"), dict):
+            storage_data["door_events"] = {}
+        if not isinstance(storage_data.get("notifications"), dict):
+            storage_data["notifications"] = {}
+        if not isinstance(storage_data.get("notification_diagnostics"), list):
+            storage_data["notification_diagnostics"] = []
+        if not isinstance(storage_data.get("alerts_state"), dict):
+            storage_data["alerts_state"] = {}
+        persisted_last_checked = str(storage_data.get("last_checked") or "").strip() or None
 
         # Friendly display name (persist and surface in multiple places for UI)
         self.device_name: str = device_name or "Akuvox Device"
@@ -198,7 +444,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             "24/7 Access": "1001",
             "No Access": "1002",
         }
-        self.events: List[Dict[str, Any]] = []  # newest first
+        self.events = []  # newest first, bounded to EVENT_HISTORY_LIMIT
         self._was_online: Optional[bool] = None
         self.event_state: Dict[str, Any] = {
             "last_user_name": None,
@@ -212,6 +458,18 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             "denied_active": False,
         }
         self._event_reset_handles: Dict[str, Callable[[], None]] = {}
+        self._offline_alert_handle: Optional[Callable[[], None]] = None
+        self._base_update_interval: Optional[timedelta] = None
+        self._applied_update_interval: Optional[timedelta] = None
+        self._seen_event_keys: "OrderedDict[str, float]" = OrderedDict()
+        self._event_facts_memo: Optional[Dict[int, Tuple[Dict[str, Any], _EventFacts]]] = None
+        self._registry_index_cache: Optional[Tuple[Any, int, Dict[Tuple[str, str], Tuple[int, str]]]] = None
+        self._domain_root_cache: Optional[Dict[str, Any]] = None
+        self._defer_listener_updates = False
+        self._listener_update_pending = False
+        self._listener_flush_scheduled = False
+        self._defer_storage_saves = False
+        self._storage_save_pending = False
         self.caller_state: Dict[str, Any] = self._empty_caller_state()
         self._caller_reset_handle: Optional[Callable[[], None]] = None
 
@@ -220,6 +478,15 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
     def display_name(self) -> str:
         return self.device_name
 
+    @property
+    def events(self) -> Deque[Dict[str, Any]]:
+        """Recent coordinator events, newest first."""
+        return self._events
+
+    @events.setter
+    def events(self, value: Iterable[Dict[str, Any]]) -> None:
+        self._events = deque(value or (), maxlen=EVENT_HISTORY_LIMIT)
+
     def set_display_name(self, name: str) -> None:
         """Update friendly name everywhere we surface it."""
         name = (name or "").strip() or "Akuvox Device"
@@ -229,8 +496,13 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
     def set_users(self, users: List[Dict[str, Any]]) -> None:
         """Store a fresh device user snapshot and record its fetch time."""
-        self.users = list(users or [])
+        users = list(users or [])
+        changed = users != (getattr(self, "users", None) or [])
+        self.users = users
         self._last_user_refresh_monotonic = time.monotonic()
+        if changed:
+            # Last-access sensors resolve names from this list.
+            self._notify_listeners()
 
     async def async_record_integrity_check(self, checked_at: Optional[str] = None) -> str:
         """Persist when device data was last compared with Home Assistant."""
@@ -272,15 +544,19 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         return list(self.users or [])
 
     def _append_event(self, text: str):
+        # Templated messages ("System notification sent to …") repeat for
+        # months; interning lets identical texts share one string in the log.
+        if type(text) is str:
+            text = sys.intern(text)
         evt = {"timestamp": _now_iso(self.hass), "Event": text}
-        self.events.insert(0, evt)
-        # keep a generous history to make UI feel “unlimited”
-        self.events[:] = self.events[:1000]
+        # keep a generous history to make UI feel “unlimited”; the deque drops
+        # the oldest entry once EVENT_HISTORY_LIMIT is reached
+        self._events.appendleft(evt)
 
     async def _kick_sync_now(self):
         """Ask the SyncQueue to sync this device immediately."""
         try:
-            root = self.hass.data.get(DOMAIN, {}) or {}
+            root = self._domain_root()
             sq = root.get("sync_queue")
             if sq:
                 # Surface an in-progress state immediately so dashboards update
@@ -290,18 +566,37 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             # best-effort only
             pass
 
-    async def _async_update_data(self):
+    async def _async_update_data(self) -> Tuple[Any, ...]:
         """HA calls this: refresh health/users/events."""
+
+        await self._async_poll_device()
+        # Door event, last-access, user list, caller and flag changes notify
+        # listeners themselves, so the post-refresh fan-out only matters when a
+        # rendered health field moved; with always_update=False an equal
+        # fingerprint skips it.
+        return self._health_fingerprint()
+
+    def _health_fingerprint(self) -> Tuple[Any, ...]:
+        health = self.health
+        return (
+            self.device_name,
+            health.get("online"),
+            health.get("status"),
+            health.get("sync_status"),
+            health.get("last_sync"),
+            health.get("device_type"),
+            health.get("last_error"),
+        )
+
+    async def _async_poll_device(self) -> None:
         # make sure our friendly name can't be lost if something rewrites health elsewhere
-        if self.health.get("name") != self.device_name:
-            self.health["name"] = self.device_name
+        self.health["name"] = self.device_name
 
         last_error = None
         last_ping = None
         now_ts = time.time()
         alerts_state: Dict[str, Any] = self.storage.data.setdefault("alerts_state", {})
         alerts_dirty = False
-        alerts_saved = False
         reboot_raw = self.health.get("rebooting_until")
         if isinstance(reboot_raw, (int, float)):
             reboot_deadline = float(reboot_raw)
@@ -311,7 +606,16 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             except (TypeError, ValueError):
                 reboot_deadline = 0.0
         reboot_active = reboot_deadline and reboot_deadline > now_ts
+        watermark_before = _door_event_watermark(self.storage.data.get("door_events") or {})
+        # Door event and notification state changes are written once at the end
+        # of the tick rather than by each step that touched storage.
+        self._defer_storage_saves = True
+        users_task: Optional["asyncio.Task[Any]"] = None
         try:
+            if self._was_online and self.users:
+                # A device that answered the last tick almost always answers
+                # this one, so let the user refresh overlap the ping.
+                users_task = asyncio.create_task(self.async_refresh_users())
             info = await self.api.ping_info()
             last_ping = info
             is_up = bool(info.get("ok"))
@@ -332,11 +636,10 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     self.health.pop("rebooting_until", None)
                 if prev is False:
                     self._append_event("Device came online")
-                elif prev is None and not self.health.get("last_sync"):
-                    # Avoid repairing users during HA startup before FaceData routes
-                    # are guaranteed to be registered. Pending profile work is picked
-                    # up by SyncQueue after Home Assistant has fully started.
-                    pass
+                # No user repair is kicked on the first tick after HA startup:
+                # FaceData routes may not be registered yet, and SyncQueue picks
+                # up pending profile work once Home Assistant has fully started.
+                self._cancel_offline_alert()
                 if alerts_state.get("offline_since"):
                     alerts_state["offline_since"] = None
                     alerts_state["offline_notified"] = False
@@ -364,42 +667,41 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 self.health["last_error"] = None
                 self.health["last_ping"] = last_ping
                 offline_since = alerts_state.get("offline_since")
-                if not offline_since:
-                    alerts_state["offline_since"] = now_ts
+                try:
+                    offline_since_val = float(offline_since) if offline_since else None
+                except Exception:
+                    offline_since_val = None
+                if offline_since_val is None:
+                    offline_since_val = now_ts
+                    alerts_state["offline_since"] = offline_since_val
                     alerts_state["offline_notified"] = False
                     alerts_dirty = True
-                else:
-                    try:
-                        offline_since_val = float(offline_since)
-                    except Exception:
-                        offline_since_val = now_ts
-                        alerts_state["offline_since"] = offline_since_val
-                        alerts_dirty = True
-                    if not alerts_state.get("offline_notified") and now_ts - offline_since_val >= 300:
-                        try:
-                            await self._send_alert_notification("device_offline", extra={"offline_since": offline_since_val})
-                        except Exception as err:
-                            _LOGGER.debug("Failed to dispatch offline notification: %s", _safe_str(err))
-                        alerts_state["offline_notified"] = True
-                        alerts_dirty = True
-                if alerts_dirty:
-                    try:
-                        await self.storage.async_save()
-                        alerts_saved = True
-                    except Exception as err:
-                        _LOGGER.debug("Failed to persist offline state: %s", _safe_str(err))
+                if not alerts_state.get("offline_notified"):
+                    self._schedule_offline_alert(offline_since_val)
                 return
 
             self.health["last_ping"] = last_ping
 
             # Load users so integrity checker & UI can see them
-            try:
-                await self.async_refresh_users()
-            except Exception:
+            if self.users:
+                # Door events only fall back to the previously loaded device
+                # user list, so the two fetches can overlap.
+                _users_result, events_result = await asyncio.gather(
+                    users_task or self.async_refresh_users(),
+                    self._process_door_events(),
+                    return_exceptions=True,
+                )
                 # don't fail the whole refresh just because the user list failed
-                pass
+                if isinstance(events_result, BaseException):
+                    raise events_result
+            else:
+                try:
+                    await self.async_refresh_users()
+                except Exception:
+                    # don't fail the whole refresh just because the user list failed
+                    pass
 
-            await self._process_door_events()
+                await self._process_door_events()
 
         except Exception as e:
             last_error = _safe_str(e)
@@ -419,7 +721,14 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     alerts_state["offline_since"] = now_ts
                     alerts_state["offline_notified"] = False
                     alerts_dirty = True
+                    self._schedule_offline_alert(now_ts)
         finally:
+            if users_task is not None:
+                if not users_task.done():
+                    # The ping found the device down or rebooting.
+                    users_task.cancel()
+                elif not users_task.cancelled():
+                    users_task.exception()  # mark a failed refresh as retrieved
             self.health["last_error"] = last_error
             self.health["last_ping"] = last_ping
             self.health["last_health_check"] = (
@@ -427,12 +736,54 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 .replace(microsecond=0)
                 .isoformat()
             )
+            self._defer_storage_saves = False
+            if alerts_dirty or getattr(self, "_storage_save_pending", False):
+                await self._async_save_storage("coordinator state")
+            self._adapt_update_interval(
+                had_new_events=_door_event_watermark(self.storage.data.get("door_events") or {})
+                != watermark_before,
+                offline_since=alerts_state.get("offline_since"),
+            )
+
+    def set_base_update_interval(self, interval: timedelta) -> None:
+        """Set the configured poll interval that adaptive polling returns to."""
+
+        self._base_update_interval = interval
+        self._applied_update_interval = interval
+        self.update_interval = interval
 
-        if alerts_dirty and not alerts_saved:
+    def _adapt_update_interval(self, *, had_new_events: bool, offline_since: Any) -> None:
+        """Poll faster while door events arrive and back off during a long outage.
+
+        The baseline is whatever was last passed to ``set_base_update_interval``;
+        the options flow and settings API set it explicitly.
+        """
+
+        current = getattr(self, "update_interval", None)
+        if not isinstance(current, timedelta):
+            return
+        base = getattr(self, "_base_update_interval", None)
+        if base is None:
+            base = current
+            self._base_update_interval = base
+
+        seconds = base.total_seconds()
+        if had_new_events:
+            seconds = min(seconds, ACTIVE_POLL_INTERVAL_SECONDS)
+        elif offline_since and not self.health.get("online"):
             try:
-                await self.storage.async_save()
-            except Exception as err:
-                _LOGGER.debug("Failed to persist alert state: %s", _safe_str(err))
+                outage = time.time() - float(offline_since)
+            except (TypeError, ValueError):
+                outage = 0.0
+            # Double the interval for every alert delay the outage has lasted.
+            steps = min(int(outage // OFFLINE_ALERT_DELAY_SECONDS), 5)
+            if steps > 0:
+                seconds = max(seconds, min(seconds * 2**steps, OFFLINE_POLL_INTERVAL_SECONDS))
+
+        interval = timedelta(seconds=seconds)
+        self._applied_update_interval = interval
+        if interval != current:
+            self.update_interval = interval
 
     async def _process_door_events(
         self,
@@ -442,6 +793,23 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
     ) -> List[Dict[str, Any]]:
         """Fetch recent door events and handle non-key access notifications."""
 
+        # History publishing, dedup and handling all consult the same rows;
+        # derive each row's facts once for the whole batch.
+        self._event_facts_memo = {}
+        try:
+            return await self._process_door_event_batch(
+                force_latest=force_latest,
+                suppress_notifications=suppress_notifications,
+            )
+        finally:
+            self._event_facts_memo = None
+
+    async def _process_door_event_batch(
+        self,
+        *,
+        force_latest: bool,
+        suppress_notifications: bool,
+    ) -> List[Dict[str, Any]]:
         notifications = self.storage.data.get("notifications") or {}
         configured_notify_targets: List[str] = list(notifications.get("targets") or [])
         notify_targets: List[str] = [] if suppress_notifications else configured_notify_targets
@@ -464,36 +832,44 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         if not events:
             return events
 
-        try:
-            self._publish_access_history(events)
-        except Exception as err:
-            _LOGGER.debug(
-                "Unable to publish door events to history for %s: %s",
-                self.entry_id,
-                _safe_str(err),
-            )
-
         state = self.storage.data.setdefault("door_events", {})
-        last_seen = _safe_str(state.get("last_event_key")) or None
-        last_seen_epoch_raw = state.get("last_event_epoch")
-        try:
-            last_seen_epoch = float(last_seen_epoch_raw)
-        except (TypeError, ValueError):
-            last_seen_epoch = 0.0
+        last_seen, last_seen_epoch = _door_event_watermark(state)
+
+        # Events arrive newest first; everything from the watermark onwards has
+        # already been handled, so locate it with a key-only scan.
+        cut = len(events)
+        if last_seen:
+            for index, event in enumerate(events):
+                if self._event_unique_key(event) == last_seen:
+                    cut = index
+                    break
+        if cut == 0 and not force_latest:
+            return events
 
+        # Only rows newer than the watermark can change the aggregated history.
+        new_events = events[:cut]
+        if new_events:
+            try:
+                self._publish_access_history(new_events)
+            except Exception as err:
+                _LOGGER.debug(
+                    "Unable to publish door events to history for %s: %s",
+                    self.entry_id,
+                    _safe_str(err),
+                )
+
+        seen_keys = self._recent_event_keys()
         events_to_process: List[Tuple[str, Dict[str, Any], float]] = []
-        for event in reversed(events):
-            key = self._event_unique_key(event)
+        for event in reversed(new_events):
+            facts = self._event_facts(event)
+            key = facts.key
             if key is None:
                 continue
-            if last_seen and key == last_seen:
-                # Drop everything collected so far (they are older events).
-                events_to_process = []
+            parsed_ts = facts.epoch
+            # Devices reuse sequential IDs after a log clear or reboot, so a
+            # remembered key only marks a duplicate when its epoch matches too.
+            if seen_keys.get(key) == parsed_ts:
                 continue
-            timestamp_text = self._extract_event_timestamp(event, fallback=False)
-            parsed_ts = 0.0
-            if timestamp_text:
-                parsed_ts = self._coerce_event_timestamp_to_epoch(timestamp_text)
             if parsed_ts and parsed_ts <= last_seen_epoch:
                 continue
             events_to_process.append((key, event, parsed_ts))
@@ -503,10 +879,9 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 latest_event: Optional[Dict[str, Any]] = None
                 latest_epoch = -1.0
                 for event in events:
-                    timestamp_text = self._extract_event_timestamp(event, fallback=False)
-                    parsed_ts = self._coerce_event_timestamp_to_epoch(timestamp_text) if timestamp_text else 0.0
-                    if parsed_ts > latest_epoch:
-                        latest_epoch = parsed_ts
+                    facts = self._event_facts(event)
+                    if facts.epoch > latest_epoch:
+                        latest_epoch = facts.epoch
                         latest_event = event
                 if latest_event:
                     if suppress_notifications:
@@ -515,13 +890,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                         latest_event["_suppressed_notification_targets"] = configured_notify_targets
                     storage_dirty = await self._handle_door_event(latest_event, notify_targets)
                     if storage_dirty:
-                        try:
-                            await self.storage.async_save()
-                        except Exception as err:
-                            _LOGGER.debug(
-                                "Unable to persist door event state: %s",
-                                _safe_str(err),
-                            )
+                        await self._async_save_storage("door event state")
             return events
 
         # Avoid processing an unbounded backlog.
@@ -532,47 +901,121 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         storage_dirty = False
         last_processed_key = last_seen
         last_processed_epoch = last_seen_epoch
-        for key, event, parsed_ts in events_to_process:
-            if suppress_notifications:
-                event = dict(event)
-                event["_skip_notifications"] = True
-                event["_suppressed_notification_targets"] = configured_notify_targets
-            if await self._handle_door_event(event, notify_targets):
-                storage_dirty = True
-            last_processed_key = key
-            if parsed_ts > last_processed_epoch:
-                last_processed_epoch = parsed_ts
-
-        if last_processed_key and last_processed_key != last_seen:
-            state["last_event_key"] = last_processed_key
-            storage_dirty = True
+        # Fan out to entity listeners once for the whole batch, not per event.
+        self._defer_listener_updates = True
+        try:
+            for key, event, parsed_ts in events_to_process:
+                if suppress_notifications:
+                    event = dict(event)
+                    event["_skip_notifications"] = True
+                    event["_suppressed_notification_targets"] = configured_notify_targets
+                if await self._handle_door_event(event, notify_targets):
+                    storage_dirty = True
+                self._remember_event_key(key, parsed_ts)
+                last_processed_key = key
+                if parsed_ts > last_processed_epoch:
+                    last_processed_epoch = parsed_ts
+        finally:
+            self._flush_listener_updates()
 
-        if last_processed_epoch > last_seen_epoch:
-            state["last_event_epoch"] = last_processed_epoch
+        watermark = (last_processed_key or last_seen, max(last_processed_epoch, last_seen_epoch))
+        if watermark != (last_seen, last_seen_epoch):
+            state["watermark"] = list(watermark)
+            state.pop("last_event_key", None)
+            state.pop("last_event_epoch", None)
             storage_dirty = True
 
         if storage_dirty:
-            try:
-                await self.storage.async_save()
-            except Exception as err:
-                _LOGGER.debug("Unable to persist door event state: %s", _safe_str(err))
+            await self._async_save_storage("door event state")
 
         return events
 
-    def _event_unique_key(self, event: Dict[str, Any]) -> Optional[str]:
+    def _notify_listeners(self) -> None:
+        """Update entity listeners once per loop turn, or once per door event batch."""
+
+        if getattr(self, "_defer_listener_updates", False):
+            self._listener_update_pending = True
+            return
+        if getattr(self, "_listener_flush_scheduled", False):
+            return
+        loop = getattr(self.hass, "loop", None)
+        if loop is None:
+            self.async_update_listeners()
+            return
+        self._listener_flush_scheduled = True
+        loop.call_soon(self._flush_scheduled_listeners)
+
+    def _flush_scheduled_listeners(self) -> None:
+        self._listener_flush_scheduled = False
+        self.async_update_listeners()
+
+    def _flush_listener_updates(self) -> None:
+        self._defer_listener_updates = False
+        if getattr(self, "_listener_update_pending", False):
+            self._listener_update_pending = False
+            self.async_update_listeners()
+
+    def _domain_root(self) -> Dict[str, Any]:
+        """Return hass.data[DOMAIN], cached once the integration has populated it."""
+
+        root = getattr(self, "_domain_root_cache", None)
+        if root is None:
+            found = self.hass.data.get(DOMAIN)
+            if not isinstance(found, dict) or not found:
+                return found or {}
+            self._domain_root_cache = root = found
+        return root
+
+    def _recent_event_keys(self) -> "OrderedDict[str, float]":
+        seen = getattr(self, "_seen_event_keys", None)
+        if seen is None:
+            seen = OrderedDict()
+            self._seen_event_keys = seen
+        return seen
+
+    def _remember_event_key(self, key: str, epoch: float) -> None:
+        """Record a handled event so overlapping or reordered fetches skip it."""
+
+        seen = self._recent_event_keys()
+        seen[key] = epoch
+        seen.move_to_end(key)
+        while len(seen) > SEEN_EVENT_KEY_LIMIT:
+            seen.popitem(last=False)
+
+    def _event_facts(self, event: Dict[str, Any]) -> _EventFacts:
+        """Extract the key, timestamp and epoch of an event in one pass."""
+
+        memo: Optional[Dict[int, Tuple[Dict[str, Any], _EventFacts]]] = getattr(
+            self, "_event_facts_memo", None
+        )
+        if memo is not None:
+            cached = memo.get(id(event))
+            if cached is not None and cached[0] is event:
+                return cached[1]
+
+        timestamp = self._extract_event_timestamp(event, fallback=False)
+        epoch = self._coerce_event_timestamp_to_epoch(timestamp) if timestamp else 0.0
+        facts = _EventFacts(self._event_unique_key(event, timestamp=timestamp), timestamp, epoch)
+        if memo is not None:
+            # Keep the event alive alongside its facts so the id cannot be reused.
+            memo[id(event)] = (event, facts)
+        return facts
+
+    def _event_unique_key(self, event: Dict[str, Any], *, timestamp: Any = _UNRESOLVED) -> Optional[str]:
         """Generate a stable identifier for a door event."""
 
-        for key in ("Index", "ID", "LogID", "LogId", "EventID", "EventId", "SN", "Sn"):
+        for key in self._EVENT_ID_KEYS:
             val = event.get(key)
             if val not in (None, ""):
-                return _safe_str(val)
+                return val if type(val) is str else _safe_str(val)
 
-        timestamp = self._extract_event_timestamp(event, fallback=False)
+        if timestamp is _UNRESOLVED:
+            timestamp = self._extract_event_timestamp(event, fallback=False)
         description = None
-        for key in ("Event", "EventType", "Type", "Description"):
+        for key in self._EVENT_DESCRIPTION_KEYS:
             value = event.get(key)
             if value not in (None, ""):
-                description = _safe_str(value)
+                description = value if type(value) is str else _safe_str(value)
                 break
         user_id = self._extract_event_user_id(event)
         parts = [p for p in (timestamp, description, user_id) if p]
@@ -581,7 +1024,8 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
         if event:
             try:
-                return "|".join(f"{k}:{_safe_str(event.get(k))}" for k in sorted(event.keys()))
+                fingerprint = repr(sorted((_safe_str(k), _safe_str(v)) for k, v in event.items()))
+                return hashlib.blake2b(fingerprint.encode("utf-8", "replace"), digest_size=8).hexdigest()
             except Exception:
                 pass
 
@@ -601,7 +1045,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
     @classmethod
     def _event_date_component(cls, event: Dict[str, Any]) -> Optional[str]:
-        for key in ("DateTime", "datetime", "Date", "date", "EventDate", "LogDate"):
+        for key in cls._EVENT_DATE_KEYS:
             text = cls._clean_event_component(event.get(key))
             if text:
                 return text
@@ -609,7 +1053,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
     @classmethod
     def _event_time_component(cls, event: Dict[str, Any]) -> Optional[str]:
-        for key in ("Time", "time", "EventTime", "LogTime", "RecordTime", "timestamp", "Timestamp"):
+        for key in cls._EVENT_TIME_KEYS:
             text = cls._clean_event_component(event.get(key))
             if text:
                 return text
@@ -624,28 +1068,26 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         return date_text or time_text
 
     def _extract_event_timestamp(self, event: Dict[str, Any], *, fallback: bool = True) -> Optional[str]:
+        # Fast path for the usual Akuvox shape: a "Date" plus a clock-only "Time".
+        # A "DateTime" field would take priority below, so only shortcut without one.
+        if "DateTime" not in event and "datetime" not in event:
+            time_text = self._clean_event_component(event.get("Time"))
+            if time_text and _is_time_only(time_text):
+                date_text = self._clean_event_component(event.get("Date"))
+                if date_text:
+                    return f"{date_text} {time_text}"
+
         date_text = self._event_date_component(event)
         time_only: Optional[str] = None
 
-        for key in (
-            "Time",
-            "time",
-            "DateTime",
-            "datetime",
-            "Timestamp",
-            "timestamp",
-            "CreateTime",
-            "RecordTime",
-            "LogTime",
-            "EventTime",
-        ):
+        for key in self._EVENT_TIMESTAMP_KEYS:
             raw = event.get(key)
             cleaned = self._clean_event_component(raw)
             if not cleaned:
                 continue
             lowered = key.lower()
             if lowered in {"time", "timestamp", "recordtime", "logtime", "eventtime"}:
-                if lowered == "time" and _TIME_ONLY_RE.match(cleaned):
+                if lowered == "time" and _is_time_only(cleaned):
                     if date_text:
                         return f"{date_text} {cleaned}"
                     time_only = time_only or cleaned
@@ -665,19 +1107,10 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         return None
 
     def _extract_event_user_id(self, event: Dict[str, Any]) -> Optional[str]:
-        for key in (
-            "UserID",
-            "UserId",
-            "User",
-            "UserName",
-            "Name",
-            "CardNo",
-            "CardNumber",
-            "ID",
-        ):
+        for key in self._EVENT_USER_KEYS:
             val = event.get(key)
             if val not in (None, ""):
-                return _safe_str(val)
+                return val if type(val) is str else _safe_str(val)
         return None
 
     @staticmethod
@@ -754,44 +1187,22 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     return canonical
 
         try:
-            root = self.hass.data.get(DOMAIN, {}) or {}
+            root = self._domain_root()
             users_store = root.get("users_store")
-            registry = users_store.all() if users_store and hasattr(users_store, "all") else {}
         except Exception:
-            registry = {}
-        if isinstance(registry, dict):
-            for key, profile in registry.items():
-                canonical = normalize_user_id(key) or _safe_str(key).strip()
-                if not canonical:
-                    continue
-                values: List[Any] = [key, canonical]
-                if isinstance(profile, dict):
-                    values.extend(
-                        [
-                            profile.get("name"),
-                            profile.get("Name"),
-                            profile.get("UserName"),
-                            profile.get("UserID"),
-                            profile.get("UserId"),
-                            profile.get("ID"),
-                            profile.get("ha_user_id"),
-                            profile.get("home_assistant_user_id"),
-                            profile.get("HomeAssistantUserID"),
-                            profile.get("device_id"),
-                            profile.get("card_code"),
-                            profile.get("CardCode"),
-                        ]
-                    )
-                    ha_user_ids = profile.get("ha_user_ids") or profile.get("home_assistant_user_ids")
-                    if isinstance(ha_user_ids, (list, tuple, set)):
-                        values.extend(ha_user_ids)
-                    device_ids = profile.get("device_ids") or profile.get("device_user_ids")
-                    if isinstance(device_ids, dict):
-                        values.extend(device_ids.values())
-                    elif isinstance(device_ids, (list, tuple, set)):
-                        values.extend(device_ids)
-                if any(_matches_any(value) for value in values):
-                    return canonical
+            users_store = None
+        if users_store:
+            registry_index = self._registry_match_index(users_store)
+            best_match: Optional[Tuple[int, str]] = None
+            for candidate in candidates:
+                for lookup in (("text", candidate.casefold()), ("id", normalize_user_id(candidate))):
+                    if not lookup[1]:
+                        continue
+                    hit = registry_index.get(lookup)
+                    if hit is not None and (best_match is None or hit < best_match):
+                        best_match = hit
+            if best_match is not None:
+                return best_match[1]
 
         users = self.users if isinstance(self.users, list) else []
         if not users:
@@ -846,18 +1257,79 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
         return resolved
 
+    @staticmethod
+    def _registry_profile_values(key: Any, canonical: str, profile: Any) -> List[Any]:
+        values: List[Any] = [key, canonical]
+        if isinstance(profile, dict):
+            values.extend(
+                [
+                    profile.get("name"),
+                    profile.get("Name"),
+                    profile.get("UserName"),
+                    profile.get("UserID"),
+                    profile.get("UserId"),
+                    profile.get("ID"),
+                    profile.get("ha_user_id"),
+                    profile.get("home_assistant_user_id"),
+                    profile.get("HomeAssistantUserID"),
+                    profile.get("device_id"),
+                    profile.get("card_code"),
+                    profile.get("CardCode"),
+                ]
+            )
+            ha_user_ids = profile.get("ha_user_ids") or profile.get("home_assistant_user_ids")
+            if isinstance(ha_user_ids, (list, tuple, set)):
+                values.extend(ha_user_ids)
+            device_ids = profile.get("device_ids") or profile.get("device_user_ids")
+            if isinstance(device_ids, dict):
+                values.extend(device_ids.values())
+            elif isinstance(device_ids, (list, tuple, set)):
+                values.extend(device_ids)
+        return values
+
+    def _registry_match_index(self, users_store: Any) -> Dict[Tuple[str, str], Tuple[int, str]]:
+        """Map registry profile values to ``(position, canonical id)`` for event matching.
+
+        Values are indexed both case-folded and as normalised user ids. The index
+        is reused until the store's ``revision`` changes; stores without one are
+        re-indexed on every call.
+        """
+
+        revision = getattr(users_store, "revision", None)
+        cached = getattr(self, "_registry_index_cache", None)
+        if revision is not None and cached is not None and cached[0] is users_store and cached[1] == revision:
+            return cached[2]
+
+        try:
+            registry = users_store.all() if hasattr(users_store, "all") else {}
+        except Exception:
+            registry = {}
+        index: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        if isinstance(registry, dict):
+            for position, (key, profile) in enumerate(registry.items()):
+                canonical = normalize_user_id(key) or _safe_str(key).strip()
+                if not canonical:
+                    continue
+                entry = (position, canonical)
+                for value in self._registry_profile_values(key, canonical, profile):
+                    if value is None:
+                        continue
+                    text = _safe_str(value).strip()
+                    if not text:
+                        continue
+                    # First profile wins, matching the registry's iteration order.
+                    index.setdefault(("text", text.casefold()), entry)
+                    normalized = normalize_user_id(text)
+                    if normalized:
+                        index.setdefault(("id", normalized), entry)
+
+        if revision is not None:
+            self._registry_index_cache = (users_store, revision, index)
+        return index
+
     def _is_non_key_access(self, event: Dict[str, Any]) -> bool:
         text_parts: List[str] = []
-        for key in (
-            "Event",
-            "EventType",
-            "Type",
-            "OpenMethod",
-            "AccessMethod",
-            "OpenDoorType",
-            "Mode",
-            "Way",
-        ):
+        for key in self._EVENT_METHOD_KEYS:
             val = event.get(key)
             if isinstance(val, str) and val:
                 text_parts.append(val.lower())
@@ -866,38 +1338,14 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             return False
 
         summary = " ".join(text_parts)
-        has_grant = any(
-            word in summary
-            for word in (
-                "grant",
-                "granted",
-                "permit",
-                "permitted",
-                "open",
-                "unlock",
-                "success",
-                "allowed",
-            )
-        )
-        if not has_grant:
+        if _NON_KEY_GRANT_RE.search(summary) is None:
             return False
 
-        uses_key = any(word in summary for word in ("card", "rfid", "key", "tag", "fob"))
-        return not uses_key
+        return _KEY_CREDENTIAL_RE.search(summary) is None
 
     def _event_summary_tokens(self, event: Dict[str, Any]) -> List[str]:
         tokens: List[str] = []
-        for key in (
-            "Event",
-            "EventType",
-            "Type",
-            "Description",
-            "Reason",
-            "OpenMethod",
-            "AccessMethod",
-            "Mode",
-            "Way",
-        ):
+        for key in self._EVENT_SUMMARY_KEYS:
             val = event.get(key)
             if isinstance(val, str) and val:
                 tokens.append(val.lower())
@@ -907,43 +1355,10 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         return tokens
 
     def _event_is_access_denied(self, tokens: List[str]) -> bool:
-        if not tokens:
-            return False
-        summary = " ".join(tokens)
-        denied_words = (
-            "denied",
-            "refused",
-            "invalid",
-            "failed",
-            "fail",
-            "error",
-            "unauthorized",
-            "forbidden",
-            "rejected",
-        )
-        return any(word in summary for word in denied_words)
+        return _summary_access_verdict(" ".join(tokens)) == "denied"
 
     def _event_is_access_granted(self, tokens: List[str]) -> bool:
-        if not tokens:
-            return False
-        if self._event_is_access_denied(tokens):
-            return False
-        summary = " ".join(tokens)
-        granted_words = (
-            "grant",
-            "granted",
-            "permit",
-            "permitted",
-            "allowed",
-            "success",
-            "succ",
-            "opened",
-            "open",
-            "unlock",
-            "passed",
-            "access ok",
-        )
-        return any(word in summary for word in granted_words)
+        return _summary_access_verdict(" ".join(tokens)) == "granted"
 
     @staticmethod
     def _is_access_permitted_button_event(event: Dict[str, Any]) -> bool:
@@ -952,11 +1367,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
     def _has_recent_door_event(self, window_seconds: float) -> bool:
         door_events = self.storage.data.get("door_events") or {}
-        last_epoch_raw = door_events.get("last_event_epoch")
-        try:
-            last_epoch = float(last_epoch_raw)
-        except (TypeError, ValueError):
-            return False
+        _, last_epoch = _door_event_watermark(door_events)
         if last_epoch <= 0:
             return False
         return (time.time() - last_epoch) <= window_seconds
@@ -1026,8 +1437,6 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             return 0.0
 
     def _coerce_event_timestamp_to_epoch(self, timestamp: Any) -> float:
-        from homeassistant.util import dt as dt_util
-
         if isinstance(timestamp, (int, float)):
             try:
                 return float(timestamp)
@@ -1040,35 +1449,24 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 return 0.0
         if timestamp in (None, ""):
             return 0.0
-        try:
-            text = str(timestamp).strip()
-        except Exception:
-            return 0.0
+        if type(timestamp) is str:
+            text = timestamp.strip()
+        else:
+            try:
+                text = str(timestamp).strip()
+            except Exception:
+                return 0.0
         if not text:
             return 0.0
+        return _event_text_to_epoch(text)
 
-        parsed = dt_util.parse_datetime(text)
-        if not parsed:
-            normalized = text.replace(" ", "T")
-            parsed = dt_util.parse_datetime(normalized)
-        if not parsed:
-            cleaned = text.replace("T", " ").split("+", 1)[0].split("Z", 1)[0]
-            for fmt in ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M:%S"):
-                try:
-                    parsed = dt.datetime.strptime(cleaned, fmt)
-                    break
-                except Exception:
-                    continue
-        if not parsed:
-            return 0.0
-        try:
-            if parsed.tzinfo is None:
-                return parsed.timestamp()
-            return dt_util.as_utc(parsed).timestamp()
-        except Exception:
-            return 0.0
+    def _prepare_access_history_events(
+        self,
+        events: List[Dict[str, Any]],
+        known: Container[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """Build history rows for *events*, skipping keys already in *known*."""
 
-    def _prepare_access_history_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         prepared: List[Dict[str, Any]] = []
         if not events:
             return prepared
@@ -1079,35 +1477,41 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             if not isinstance(event, dict):
                 continue
 
-            base_key = self._event_unique_key(event)
+            facts = self._event_facts(event)
+            base_key = facts.key
             if not base_key:
                 continue
 
-            timestamp_text = self._extract_event_timestamp(event) or now_iso
-            ts_value = self._event_timestamp_to_epoch(timestamp_text)
+            timestamp_text = facts.timestamp or now_iso
+            ts_value = facts.epoch or self._event_timestamp_to_epoch(timestamp_text)
 
             combined_key = f"{self.entry_id}:{base_key}"
+            if combined_key in known:
+                # The history would discard the row anyway; skip building it.
+                continue
 
-            copy = dict(event)
-            copy.setdefault("timestamp", timestamp_text)
-            copy.setdefault("Time", timestamp_text)
-            copy["_key"] = combined_key
-            copy["_device"] = self.device_name
-            copy["_device_id"] = self.entry_id
-            copy["_source"] = "doorlog"
+            # Defaults first so the device's own timestamp/Time fields win.
+            copy = {
+                "timestamp": timestamp_text,
+                "Time": timestamp_text,
+                **event,
+                "_key": combined_key,
+                "_device": self.device_name,
+                "_device_id": self.entry_id,
+                "_source": "doorlog",
+            }
             copy["_category"] = categorize_event(copy, self.health)
             copy["_t"] = ts_value
 
-            tokens = self._event_summary_tokens(event)
-            if tokens:
-                if self._event_is_access_denied(tokens):
-                    copy.setdefault("Result", "Access denied")
-                elif self._event_is_access_granted(tokens):
-                    copy.setdefault("Result", "Access granted")
+            verdict = _summary_access_verdict(" ".join(self._event_summary_tokens(event)))
+            if verdict == "denied":
+                copy.setdefault("Result", "Access denied")
+            elif verdict == "granted":
+                copy.setdefault("Result", "Access granted")
 
             prepared.append(copy)
 
-        prepared.sort(key=lambda e: e.get("_t", 0.0), reverse=True)
+        prepared.sort(key=itemgetter("_t"), reverse=True)
         return prepared
 
     def _publish_access_history(self, events: List[Dict[str, Any]]) -> None:
@@ -1115,7 +1519,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             return
 
         try:
-            root = self.hass.data.get(DOMAIN, {}) or {}
+            root = self._domain_root()
         except Exception:
             return
 
@@ -1127,10 +1531,13 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             limit = access_history_storage_limit(root)
         except Exception:
             limit = DEFAULT_ACCESS_HISTORY_LIMIT
+        if limit <= 0:
+            return
         cutoff = access_history_retention_cutoff(root)
 
-        prepared = self._prepare_access_history_events(events)
-        if not prepared or limit <= 0:
+        known = history if hasattr(history, "__contains__") else ()
+        prepared = self._prepare_access_history_events(events, known)
+        if not prepared:
             return
 
         try:
@@ -1152,11 +1559,14 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         last_access = self.storage.data.setdefault("last_access", {})
 
         user_id = self._resolve_event_user_id(event)
-        timestamp = self._extract_event_timestamp(event)
+        timestamp = self._event_facts(event).timestamp or _now_iso(self.hass)
         if user_id and timestamp:
             if last_access.get(user_id) != timestamp:
                 last_access[user_id] = timestamp
                 storage_changed = True
+                # The last-access sensors read this map directly, and events
+                # without a verdict never reach _update_access_state.
+                self._notify_listeners()
 
         if self._is_non_key_access(event):
             payload = {
@@ -1173,10 +1583,10 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             if notify_targets and not skip_notifications:
                 await self._dispatch_notification(event, notify_targets)
 
-        tokens = self._event_summary_tokens(event)
-        summary_text = " ".join(tokens)
+        summary_text = " ".join(self._event_summary_tokens(event))
+        verdict = _summary_access_verdict(summary_text)
         event_kind: Optional[str] = None
-        if tokens and self._event_is_access_denied(tokens):
+        if verdict == "denied":
             if not skip_notifications:
                 try:
                     await self._send_alert_notification(
@@ -1188,7 +1598,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 except Exception as err:
                     _LOGGER.debug("Failed to dispatch denied alert: %s", _safe_str(err))
             event_kind = "denied"
-        elif tokens and self._event_is_access_granted(tokens):
+        elif verdict == "granted":
             if not skip_notifications:
                 try:
                     await self._send_alert_notification(
@@ -1212,7 +1622,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 storage_changed = True
             self._update_access_state(event_kind, event, user_id=user_id, summary=summary_text or None)
             if event_kind == "granted":
-                manager = self.hass.data.get(DOMAIN, {}).get("sync_manager")
+                manager = self._domain_root().get("sync_manager")
                 if manager:
                     try:
                         await manager.handle_access_granted(
@@ -1272,11 +1682,9 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
         # Always notify listeners so downstream sensors refresh even if the
         # latest event reuses existing state (e.g. duplicate grant within timer).
-        self.async_update_listeners()
+        self._notify_listeners()
 
     def _parse_access_timestamp(self, value: Any) -> Optional[dt.datetime]:
-        from homeassistant.util import dt as dt_util
-
         if isinstance(value, dt.datetime):
             return dt_util.as_utc(value)
         if isinstance(value, (int, float)):
@@ -1332,9 +1740,11 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         }
 
     def _activate_event_flag(self, flag: str) -> bool:
-        prev = bool(self.event_state.get(flag))
-        self.event_state[flag] = True
-        handle = self._event_reset_handles.pop(flag, None)
+        state = self.event_state
+        handles = self._event_reset_handles
+        prev = bool(state.get(flag))
+        state[flag] = True
+        handle = handles.pop(flag, None)
         if handle:
             try:
                 handle()
@@ -1342,17 +1752,18 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 pass
 
         def _reset(_now):
-            self.event_state[flag] = False
-            self._event_reset_handles.pop(flag, None)
-            self.async_update_listeners()
+            state[flag] = False
+            handles.pop(flag, None)
+            self._notify_listeners()
 
-        self._event_reset_handles[flag] = async_call_later(self.hass, 3, _reset)
+        handles[flag] = async_call_later(self.hass, 3, _reset)
         return not prev
 
     def _deactivate_event_flag(self, flag: str) -> bool:
-        if not self.event_state.get(flag):
+        state = self.event_state
+        if not state.get(flag):
             return False
-        self.event_state[flag] = False
+        state[flag] = False
         handle = self._event_reset_handles.pop(flag, None)
         if handle:
             try:
@@ -1361,22 +1772,57 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 pass
         return True
 
+    def _cancel_offline_alert(self) -> None:
+        handle = getattr(self, "_offline_alert_handle", None)
+        if handle:
+            try:
+                handle()
+            except Exception:
+                pass
+        self._offline_alert_handle = None
+
+    def _schedule_offline_alert(self, offline_since: float) -> None:
+        """Arm a one-shot timer for the offline alert unless one is already pending."""
+
+        if getattr(self, "_offline_alert_handle", None):
+            return
+        delay = max(0.0, OFFLINE_ALERT_DELAY_SECONDS - (time.time() - offline_since))
+
+        def _fire(_now):
+            self._offline_alert_handle = None
+            self.hass.async_create_task(self._async_send_offline_alert())
+
+        try:
+            self._offline_alert_handle = async_call_later(self.hass, delay, _fire)
+        except Exception:
+            self._offline_alert_handle = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending offline alert before the coordinator is discarded."""
+        self._cancel_offline_alert()
+        await super().async_shutdown()
+
+    async def _async_send_offline_alert(self) -> None:
+        # A reboot or recovery since the timer was armed means there is nothing
+        # to report; the next offline poll re-arms the timer if still needed.
+        # A timer that fired while the entry was unloading must not alert either.
+        if getattr(self, "_shutdown_requested", False):
+            return
+        if self.health.get("status") != "offline":
+            return
+        alerts_state = self.storage.data.setdefault("alerts_state", {})
+        offline_since = alerts_state.get("offline_since")
+        if not offline_since or alerts_state.get("offline_notified"):
+            return
+        try:
+            await self._send_alert_notification("device_offline", extra={"offline_since": offline_since})
+        except Exception as err:
+            _LOGGER.debug("Failed to dispatch offline notification: %s", _safe_str(err))
+        alerts_state["offline_notified"] = True
+        await self._async_save_storage("offline alert state")
+
     def _empty_caller_state(self) -> Dict[str, Any]:
-        return {
-            "caller_id": None,
-            "caller_name": None,
-            "caller_number": None,
-            "raw_number": None,
-            "digits": None,
-            "call_id": None,
-            "call_type": None,
-            "timestamp": None,
-            "age_seconds": None,
-            "key_holder": None,
-            "status": None,
-            "error": None,
-            "source": None,
-        }
+        return _EMPTY_CALLER_STATE.copy()
 
     def _cancel_caller_reset(self) -> None:
         handle = self._caller_reset_handle
@@ -1398,24 +1844,20 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
 
     def _set_caller_state(self, state: Dict[str, Any], *, auto_clear: bool) -> None:
         self.caller_state = state
-        self.async_update_listeners()
+        self._notify_listeners()
         if auto_clear:
             self._schedule_caller_clear()
         else:
             self._cancel_caller_reset()
 
     def _extract_event_user_name(self, event: Dict[str, Any]) -> Optional[str]:
-        for key in (
-            "Name",
-            "UserName",
-            "User",
-            "UserID",
-            "UserId",
-            "ID",
-            "CardNo",
-            "CardNumber",
-        ):
-            val = event.get(key)
+        present = self._EVENT_USER_NAME_KEY_SET.intersection(event)
+        if not present:
+            return None
+        for key in self._EVENT_USER_NAME_KEYS:
+            if key not in present:
+                continue
+            val = event[key]
             if val in (None, ""):
                 continue
             text = _safe_str(val).strip()
@@ -1426,19 +1868,17 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
     def _extract_event_key_holder(
         self, event: Dict[str, Any], *, user_id: Optional[str]
     ) -> Optional[bool]:
-        for key in ("key_holder", "KeyHolder", "keyHolder"):
+        for key in self._KEY_HOLDER_KEYS:
             if key in event:
-                flag = event.get(key)
+                flag = event[key]
                 if isinstance(flag, bool):
                     return flag
                 if isinstance(flag, (int, float)):
                     return bool(flag)
                 if isinstance(flag, str):
-                    lower = flag.strip().lower()
-                    if lower in {"1", "true", "t", "yes", "y", "on"}:
-                        return True
-                    if lower in {"0", "false", "f", "no", "n", "off"}:
-                        return False
+                    parsed = _BOOL_WORDS.get(flag.strip().lower())
+                    if parsed is not None:
+                        return parsed
 
         if not user_id:
             return None
@@ -1448,7 +1888,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             return None
 
         try:
-            root = self.hass.data.get(DOMAIN, {}) or {}
+            root = self._domain_root()
             store = root.get("users_store")
         except Exception:
             store = None
@@ -1520,9 +1960,12 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             items = []
 
         now_local = dt.datetime.now()
-        now_utc = dt.datetime.now(dt.timezone.utc)
+        now_utc: Optional[dt.datetime] = None
 
-        best: Optional[Dict[str, Any]] = None
+        lookback = CALLER_LOOKBACK_SECONDS
+        # (age_seconds, raw, timestamp, call_type) of the freshest received call;
+        # the full candidate record is only built for the winner.
+        best_entry: Optional[Tuple[float, Dict[str, Any], dt.datetime, str]] = None
 
         for raw in items:
             if not isinstance(raw, dict):
@@ -1540,41 +1983,44 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                 if timestamp.tzinfo is None:
                     age_seconds = (now_local - timestamp).total_seconds()
                 else:
-                    age_seconds = (now_utc - timestamp.astimezone(dt.timezone.utc)).total_seconds()
+                    # Aware datetimes subtract in UTC already; no astimezone needed.
+                    if now_utc is None:
+                        now_utc = dt.datetime.now(dt.timezone.utc)
+                    age_seconds = (now_utc - timestamp).total_seconds()
             except Exception:
                 continue
 
             if age_seconds < 0:
                 continue
 
-            if CALLER_LOOKBACK_SECONDS and age_seconds > CALLER_LOOKBACK_SECONDS:
+            if lookback and age_seconds > lookback:
                 continue
 
-            raw_number = _call_entry_number(raw) or ""
-            normalized = _normalize_call_number(raw_number)
-            digits = _digits_only(normalized)
+            age_seconds = round(age_seconds, 2)
+            if best_entry is None or age_seconds < best_entry[0]:
+                best_entry = (age_seconds, raw, timestamp, call_type)
 
-            candidate = {
-                "raw": raw,
-                "call_type": call_type or "received",
-                "timestamp": timestamp,
-                "age_seconds": round(age_seconds, 2),
-                "raw_number": raw_number,
-                "normalized": normalized,
-                "digits": digits,
-                "call_id": _call_entry_id(raw),
-            }
-
-            if best is None or candidate["age_seconds"] < best["age_seconds"]:
-                best = candidate
-
-        if not best:
+        if best_entry is None:
             state["status"] = "no_match"
             state["error"] = "no_recent_call"
             self._set_caller_state(state, auto_clear=True)
             return state
 
-        root = self.hass.data.get(DOMAIN, {}) or {}
+        age_seconds, raw, timestamp, call_type = best_entry
+        raw_number = _call_entry_number(raw) or ""
+        normalized = _normalize_call_number(raw_number)
+        best: Dict[str, Any] = {
+            "raw": raw,
+            "call_type": call_type or "received",
+            "timestamp": timestamp,
+            "age_seconds": age_seconds,
+            "raw_number": raw_number,
+            "normalized": normalized,
+            "digits": _digits_only(normalized),
+            "call_id": _call_entry_id(raw),
+        }
+
+        root = self._domain_root()
         try:
             phone_index = _build_phone_index(root)
         except Exception:
@@ -1642,7 +2088,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         self._link_caller_state_to_events(state, pressed_at, events_by_device)
 
     async def _refresh_access_histories_for_all_devices(self) -> List[Tuple["AkuvoxCoordinator", List[Dict[str, Any]]]]:
-        root = self.hass.data.get(DOMAIN, {}) or {}
+        root = self._domain_root()
         if not isinstance(root, dict):
             return []
 
@@ -1664,7 +2110,7 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         results: List[Tuple[AkuvoxCoordinator, List[Dict[str, Any]]]] = []
         responses = await asyncio.gather(*tasks, return_exceptions=True)
         for coord, response in zip(coords, responses):
-            if isinstance(response, Exception):
+            if isinstance(response, BaseException):
                 continue
             if isinstance(response, list):
                 events = response
@@ -1860,12 +2306,15 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         self,
         event: Optional[Dict[str, Any]],
         user_name: Optional[str] = None,
+        *,
+        method: Any = _UNRESOLVED,
     ) -> str:
         who = user_name
         if not who and isinstance(event, dict):
             who = self._extract_event_user_name(event) or self._extract_event_user_id(event)
         who = who or "Unknown user"
-        method = self._access_method_label(event)
+        if method is _UNRESOLVED:
+            method = self._access_method_label(event)
         suffix = f" via {method}" if method else ""
         return f"{who} opened the gate{suffix}."
 
@@ -2023,14 +2472,23 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             reason="Notifications were suppressed for this access history refresh.",
         )
 
-    async def _async_save_notification_diagnostics(self) -> None:
+    async def _async_save_storage(self, context: str) -> None:
+        """Persist coordinator storage, or defer to the end of the current poll."""
+
+        if getattr(self, "_defer_storage_saves", False):
+            self._storage_save_pending = True
+            return
+        self._storage_save_pending = False
         saver = getattr(self.storage, "async_save", None)
         if not callable(saver):
             return
         try:
             await saver()
         except Exception as err:
-            _LOGGER.debug("Failed to persist notification diagnostics: %s", _safe_str(err))
+            _LOGGER.debug("Failed to persist %s: %s", context, _safe_str(err))
+
+    async def _async_save_notification_diagnostics(self) -> None:
+        await self._async_save_storage("notification diagnostics")
 
     async def _dispatch_notification(self, event: Dict[str, Any], notify_targets: List[str]) -> None:
         """Send notifications for a door event (best effort)."""
@@ -2038,6 +2496,11 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
         if not notify_targets:
             return
 
+        # Targets exist, so resolve each event fact once for every target.
+        user_id = self._extract_event_user_id(event)
+        user_name = self._extract_event_user_name(event)
+        event_summary = self._notification_event_summary(event)
+
         service = getattr(self.hass, "services", None)
         if service is None or not hasattr(service, "async_call"):
             for target in notify_targets:
@@ -2048,18 +2511,18 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     status="skipped",
                     target=target,
                     title=self.device_name,
-                    message=self._notification_event_summary(event),
-                    user_id=self._extract_event_user_id(event),
-                    user_name=self._extract_event_user_name(event),
-                    event_summary=self._notification_event_summary(event),
+                    message=event_summary,
+                    user_id=user_id,
+                    user_name=user_name,
+                    event_summary=event_summary,
                     reason="Home Assistant notify service was unavailable.",
                 )
             await self._async_save_notification_diagnostics()
             return
 
-        user_label = self._extract_event_user_name(event) or self._extract_event_user_id(event)
-        message = self._access_granted_notification_message(event, user_label)
+        user_label = user_name or user_id
         access_method = self._access_method_label(event)
+        message = self._access_granted_notification_message(event, user_label, method=access_method)
         notification_data: Dict[str, Any] = {
             "event": event,
             "device_name": self.device_name,
@@ -2072,12 +2535,19 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             "data": notification_data,
         }
 
+        user_label = user_label or "Unknown user"
+
+        # Fire every target concurrently, then record outcomes in target order.
+        call = service.async_call
+        responses = await asyncio.gather(
+            *(call("notify", target, data, blocking=False) for target in notify_targets),
+            return_exceptions=True,
+        )
+
         notification_diag_dirty = False
-        for target in notify_targets:
+        for target, response in zip(notify_targets, responses):
             target_label = self._format_notification_target(target)
-            user_label = user_label or "Unknown user"
-            try:
-                await service.async_call("notify", target, data, blocking=False)
+            if not isinstance(response, BaseException):
                 self._append_event(
                     f"System notification sent to {target_label} — {message.rstrip('.')}"
                 )
@@ -2089,11 +2559,12 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     target=target,
                     title=self.device_name,
                     message=message,
-                    user_id=self._extract_event_user_id(event),
+                    user_id=user_id,
                     user_name=user_label,
-                    event_summary=self._notification_event_summary(event),
+                    event_summary=event_summary,
                 ) or notification_diag_dirty
-            except Exception as err:
+            else:
+                err = response
                 self._append_event(
                     f"System notification failed for {target_label} — {_safe_str(err)}"
                 )
@@ -2105,9 +2576,9 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     target=target,
                     title=self.device_name,
                     message=message,
-                    user_id=self._extract_event_user_id(event),
+                    user_id=user_id,
                     user_name=user_label,
-                    event_summary=self._notification_event_summary(event),
+                    event_summary=event_summary,
                     error=_safe_str(err),
                 ) or notification_diag_dirty
                 _LOGGER.debug("Failed to dispatch notification to %s: %s", target, _safe_str(err))
@@ -2166,8 +2637,8 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             who = self._extract_event_user_name(event) if event else None
             if not who:
                 who = user_id or "Unknown user"
-            message = self._access_granted_notification_message(event, who)
             access_method = self._access_method_label(event)
+            message = self._access_granted_notification_message(event, who, method=access_method)
             if access_method:
                 data["access_method"] = access_method
         else:
@@ -2193,15 +2664,16 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
             await self._async_save_notification_diagnostics()
             return
 
+        payload = {"title": title, "message": message, "data": data}
+        call = service.async_call
+        responses = await asyncio.gather(
+            *(call("notify", target, payload, blocking=False) for target in targets),
+            return_exceptions=True,
+        )
+
         notification_diag_dirty = False
-        for target in targets:
-            try:
-                await service.async_call(
-                    "notify",
-                    target,
-                    {"title": title, "message": message, "data": data},
-                    blocking=False,
-                )
+        for target, response in zip(targets, responses):
+            if not isinstance(response, BaseException):
                 notification_diag_dirty = self._record_notification_diagnostic(
                     source="system_alert",
                     channel="alert_notification",
@@ -2214,7 +2686,8 @@ class AkuvoxCoordinator(DataUpdateCoordinator):
                     user_name=who if event_type == "user_granted" else None,
                     event_summary=summary,
                 ) or notification_diag_dirty
-            except Exception as err:
+            else:
+                err = response
                 notification_diag_dirty = self._record_notification_diagnostic(
                     source="system_alert",
                     channel="alert_notification",
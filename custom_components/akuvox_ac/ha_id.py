@@ -1,12 +1,23 @@
 """Utilities for working with Akuvox HA user identifiers."""
 from __future__ import annotations
 
+import re
 from typing import Any, Optional
 
+# ``\d`` accepts exactly the decimal digits ``int()`` can parse.
+_HA_ID_RE = re.compile(r"HA-?(\d+)")
+_TEMP_ID_RE = re.compile(r"TMP-?(\d+)")
+
 
 def normalize_ha_id(value: Any) -> Optional[str]:
     """Return the canonical HA identifier (HA###…) or None if invalid."""
 
+    # Registry keys and stored ids are nearly always canonical already.
+    if type(value) is str and len(value) == 5 and value[:2] == "HA":
+        suffix = value[2:]
+        if suffix.isascii() and suffix.isdigit():
+            return value
+
     if isinstance(value, (bytes, bytearray)):
         try:
             value = value.decode()
@@ -15,21 +26,10 @@ def normalize_ha_id(value: Any) -> Optional[str]:
     if not isinstance(value, str):
         return None
 
-    candidate = value.strip()
-    if len(candidate) < 3:
-        return None
-
-    prefix = candidate[:2].upper()
-    if prefix != "HA":
-        return None
-
-    suffix = candidate[2:]
-    if suffix.startswith("-"):
-        suffix = suffix[1:]
-    if not suffix or not suffix.isdigit():
+    match = _HA_ID_RE.fullmatch(value.strip().upper())
+    if match is None:
         return None
-
-    return f"HA{int(suffix):03d}"
+    return f"HA{int(match.group(1)):03d}"
 
 
 def normalize_temp_id(value: Any) -> Optional[str]:
@@ -43,21 +43,10 @@ def normalize_temp_id(value: Any) -> Optional[str]:
     if not isinstance(value, str):
         return None
 
-    candidate = value.strip()
-    if len(candidate) < 4:
-        return None
-
-    prefix = candidate[:3].upper()
-    if prefix != "TMP":
+    match = _TEMP_ID_RE.fullmatch(value.strip().upper())
+    if match is None:
         return None
-
-    suffix = candidate[3:]
-    if suffix.startswith("-"):
-        suffix = suffix[1:]
-    if not suffix or not suffix.isdigit():
-        return None
-
-    return f"TMP{int(suffix):03d}"
+    return f"TMP{int(match.group(1)):03d}"
 
 
 def normalize_user_id(value: Any) -> Optional[str]:
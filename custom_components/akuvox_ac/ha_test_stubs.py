@@ -103,6 +103,9 @@ def ensure_homeassistant_stubs() -> None:
         async def async_request_refresh(self):
             return None
 
+        async def async_shutdown(self):
+            self._shutdown_requested = True
+
     update_coordinator_module.DataUpdateCoordinator = _DataUpdateCoordinator
 
     http_view_module = types.ModuleType("homeassistant.components.http.view")
@@ -113,6 +116,9 @@ def ensure_homeassistant_stubs() -> None:
         async def get(self, request):
             raise NotImplementedError
 
+        def json(self, result, status_code=200, headers=None):
+            return {"args": (result,), "kwargs": {"status": status_code, "headers": headers}}
+
     http_view_module.HomeAssistantView = _HomeAssistantView
 
     http_auth_module = types.ModuleType("homeassistant.components.http.auth")
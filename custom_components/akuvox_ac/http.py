@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import inspect
 import json
 import logging
 import json
+import os
 import platform
 import re
 import secrets
 import time
-from functools import partial
+from functools import lru_cache, partial
 from datetime import timedelta
 from pathlib import Path
 from collections import OrderedDict
@@ -79,6 +81,7 @@ from .reboot_schedule import normalize_reboot_schedule
 
 COMPONENT_ROOT = Path(__file__).parent
 STATIC_ROOT = COMPONENT_ROOT / "www"
+_STATIC_ROOT_PREFIX = os.path.join(os.path.abspath(STATIC_ROOT), "")
 FACE_DATA_PATH = "/api/AK_AC/FaceData"
 FACE_FILE_EXTENSIONS = ("jpg", "jpeg", "png", "webp")
 SUPPORT_BUNDLE_LOG_TAIL_BYTES = 192 * 1024
@@ -90,26 +93,37 @@ EXIT_PERMISSION_MATCH = "match"
 EXIT_PERMISSION_WORKING_DAYS = "working_days"
 EXIT_PERMISSION_ALWAYS = "always"
 _TIME_ONLY_TEXT_RE = re.compile(r"^\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?$")
+# "mobi" also covers "mobile" and "iemobile".
+_MOBILE_USER_AGENT_RE = re.compile(r"mobi|iphone|ipod|ipad|tablet|windows phone|opera mini")
+_HEAD_CLOSE_RE = re.compile(r"</head>", re.IGNORECASE)
+_INJECT_POINT_RE = re.compile(r"(?P<head></head>)|(?P<body><body[^>]*>)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _resolved_dir(path: str) -> Path:
+    """Resolve a fixed directory once; face lookups ask for the same few per user."""
+
+    return Path(path).resolve()
 
 
 def _component_face_dir() -> Path:
     """Return the canonical location for bundled face assets."""
 
-    return (COMPONENT_ROOT / "www" / "FaceData").resolve()
+    return _resolved_dir(str(COMPONENT_ROOT / "www" / "FaceData"))
 
 
 def face_storage_dir(hass: HomeAssistant) -> Path:
     """Return the persistent storage location for uploaded face images."""
 
     base = Path(hass.config.path(DOMAIN))
-    return (base / "FaceData").resolve()
+    return _resolved_dir(str(base / "FaceData"))
 
 
 def _legacy_face_dir(hass: HomeAssistant) -> Path:
     """Legacy location used by earlier builds for face images."""
 
     root = Path(hass.config.path("www"))
-    return (root / "AK_Access_ctrl" / "FaceData").resolve()
+    return _resolved_dir(str(root / "AK_Access_ctrl" / "FaceData"))
 
 
 def _folder_migration_candidates(hass: HomeAssistant) -> List[Path]:
@@ -160,20 +174,53 @@ def _maybe_migrate_component_folder(hass: HomeAssistant) -> bool:
 
 
 def _face_candidate(base: Path, user_id: str, ext: str) -> Optional[Path]:
+    # Lexical containment is enough here: the face directories are written
+    # only by this integration, so there are no symlinks to chase per lookup.
     try:
-        candidate = (base / f"{user_id}.{ext}").resolve()
-        candidate.relative_to(base)
+        prefix = os.path.join(str(base), "")
+        candidate = os.path.abspath(os.path.join(prefix, f"{user_id}.{ext}"))
     except Exception:
         return None
-    return candidate
+    if not candidate.startswith(prefix):
+        return None
+    return Path(candidate)
+
+
+_FACE_DIR_LISTINGS: Dict[str, Tuple[int, frozenset]] = {}
+# Coarse mtime filesystems can hide a write made in the same tick as a scan,
+# so a listing is only cached once the directory has been quiet this long.
+_FACE_DIR_SETTLE_NS = 2_000_000_000
+
+
+def _face_dir_file_names(base: Path) -> frozenset:
+    """Return the file names in a face directory, rescanned only when it changes."""
+
+    key = str(base)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        _FACE_DIR_LISTINGS.pop(key, None)
+        return frozenset()
+    cached = _FACE_DIR_LISTINGS.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(key) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+    if time.time_ns() - mtime >= _FACE_DIR_SETTLE_NS:
+        _FACE_DIR_LISTINGS[key] = (mtime, names)
+    else:
+        _FACE_DIR_LISTINGS.pop(key, None)
+    return names
 
 
 def _face_file_exists_in(base: Path, user_id: str) -> bool:
-    for ext in FACE_FILE_EXTENSIONS:
-        candidate = _face_candidate(base, user_id, ext)
-        if candidate is not None and candidate.is_file():
-            return True
-    return False
+    names = _face_dir_file_names(base)
+    if not names:
+        return False
+    return any(f"{user_id}.{ext}" in names for ext in FACE_FILE_EXTENSIONS)
 
 
 def _remove_face_files(hass: HomeAssistant, user_id: str) -> None:
@@ -271,6 +318,26 @@ def _face_image_exists(hass: HomeAssistant, user_id: str) -> bool:
         return False
 
 
+def _build_face_index(hass: HomeAssistant) -> Set[str]:
+    """Return the ids with a face image in any face directory, listing each once."""
+
+    face_dirs: List[Path] = []
+    for resolver in (face_storage_dir, _legacy_face_dir):
+        try:
+            face_dirs.append(resolver(hass))
+        except Exception:
+            continue
+    face_dirs.append(_component_face_dir())
+
+    index: Set[str] = set()
+    for base in face_dirs:
+        for name in _face_dir_file_names(base):
+            stem, _, ext = name.rpartition(".")
+            if stem and ext in FACE_FILE_EXTENSIONS:
+                index.add(stem)
+    return index
+
+
 def _parse_access_date(value: Any) -> Optional[dt.date]:
     """Normalize stored access dates to ``date`` objects."""
 
@@ -337,22 +404,6 @@ def _extract_license_plates(record: Mapping[str, Any]) -> List[str]:
     return result
 
 
-def _normalize_boolish(value: Any) -> Optional[bool]:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
-        return bool(value)
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if not lowered:
-            return None
-        if lowered in {"1", "true", "yes", "y", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "n", "off"}:
-            return False
-    return None
-
-
 def _stringify_device_field(value: Any) -> Optional[str]:
     if value is None:
         return None
@@ -384,13 +435,16 @@ def _sanitise_device_record(record: Optional[Dict[str, Any]]) -> Dict[str, str]:
     return out
 
 
+_RECORD_USER_KEYS = ("UserID", "ID", "UserId", "userId", "Name")
+
+
 def _record_matches_user(record: Dict[str, Any], user_id: str) -> bool:
     if not isinstance(record, dict):
         return False
     target = str(user_id or "").strip()
     if not target:
         return False
-    for key in ("UserID", "UserId", "userId", "UserID", "ID", "Name"):
+    for key in _RECORD_USER_KEYS:
         candidate = record.get(key)
         if candidate is None:
             continue
@@ -662,6 +716,8 @@ SIGNED_API_PATHS: Dict[str, str] = {
     "service_delete_user": "/api/services/akuvox_ac/delete_user",
     "service_reactivate_temporary_user": "/api/services/akuvox_ac/reactivate_temporary_user",
 }
+_SIGNED_API_PATH_ITEMS: Tuple[Tuple[str, str], ...] = tuple(SIGNED_API_PATHS.items())
+_SIGNED_API_PATHS_JSON = json.dumps(SIGNED_API_PATHS)
 ALLOWED_DASHBOARD_SERVICE_PROXY: Set[str] = {
     "add_missing_users",
     "add_temporary_user",
@@ -1127,6 +1183,13 @@ def _build_phone_index(root: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not store:
         return []
 
+    # root["phone_index"] holds (users_store, revision, index) and is reused
+    # until the store reports a new revision.
+    revision = getattr(store, "revision", None)
+    cached = root.get("phone_index")
+    if revision is not None and cached is not None and cached[0] is store and cached[1] == revision:
+        return cached[2]
+
     try:
         users = store.all()
     except Exception:
@@ -1161,6 +1224,8 @@ def _build_phone_index(root: Dict[str, Any]) -> List[Dict[str, Any]]:
         }
         index.append(entry)
 
+    if revision is not None:
+        root["phone_index"] = (store, revision, index)
     return index
 
 
@@ -1454,7 +1519,7 @@ async def _process_inbound_call_webhook(
                 "call_id": _call_entry_id(raw),
                 "timestamp": timestamp,
                 "age_seconds": round(age_seconds, 2),
-                "raw": _json_clone(raw),
+                "raw": raw,
                 "call_type": call_type or "received",
                 "raw_number": raw_number or "",
                 "number": normalized_number,
@@ -1479,8 +1544,9 @@ async def _process_inbound_call_webhook(
                 "lookback_seconds": lookback,
             }
 
-    candidates.sort(key=lambda item: item.get("timestamp"), reverse=True)
-    best = candidates[0]
+    # Only the freshest call matters; a single max() pass keeps the first of
+    # any equally timed entries, exactly as the previous stable sort did.
+    best = max(candidates, key=lambda item: item.get("timestamp"))
 
     match = _match_user_by_number(best.get("digits", ""), phone_index)
 
@@ -1511,7 +1577,7 @@ async def _process_inbound_call_webhook(
         "status": result,
         "status_label": status_label,
         "lookback_seconds": lookback,
-        "call": best.get("raw"),
+        "call": _json_clone(best.get("raw")),
     }
 
     if match:
@@ -1521,7 +1587,7 @@ async def _process_inbound_call_webhook(
                 "user_name": match.get("name"),
                 "key_holder": bool(match.get("key_holder")),
                 "user_number": match.get("number"),
-                "user_profile": match.get("profile"),
+                "user_profile": _json_clone(match.get("profile")),
             }
         )
     else:
@@ -1808,21 +1874,10 @@ def _request_prefers_mobile(request: Optional[web.Request]) -> bool:
     if not lowered:
         return False
 
-    if "mobi" in lowered or "iphone" in lowered or "ipod" in lowered:
-        return True
-    if "ipad" in lowered or "tablet" in lowered:
-        return True
-    if "android" in lowered and "windows" not in lowered:
-        if "tv" in lowered and "mobile" not in lowered and "tablet" not in lowered:
-            pass
-        else:
-            return True
-    if "iemobile" in lowered or "windows phone" in lowered:
-        return True
-    if "opera mini" in lowered:
+    if _MOBILE_USER_AGENT_RE.search(lowered):
         return True
-
-    return False
+    # Android TV boxes report neither "mobile" nor "tablet" (both matched above).
+    return "android" in lowered and "windows" not in lowered and "tv" not in lowered
 
 
 def _resolve_dashboard_asset(name: str, request: Optional[web.Request]) -> Path:
@@ -1842,6 +1897,14 @@ def _resolve_dashboard_asset(name: str, request: Optional[web.Request]) -> Path:
 
     explicit_mobile = base.endswith("-mob")
     prefer_mobile = _request_prefers_mobile(request) if not explicit_mobile else True
+    return _dashboard_asset_variant(base, prefer_mobile)
+
+
+@lru_cache(maxsize=256)
+def _dashboard_asset_variant(base: str, prefer_mobile: bool) -> Path:
+    """Resolve a dashboard slug to its bundled file; assets only change on upgrade."""
+
+    explicit_mobile = base.endswith("-mob")
     candidates: List[str] = []
 
     if explicit_mobile:
@@ -1946,18 +2009,25 @@ def face_filename_from_reference(reference: str, user_id: str, default_ext: str
     return fallback
 
 
+@lru_cache(maxsize=256)
 def _static_asset(path: str) -> Path:
+    """Map a request path to a bundled file; misses raise and are not cached."""
     clean = path.strip()
     if not clean or clean.endswith("/"):
         clean = (clean.rstrip("/") + "/index.html") if clean else "index.html"
-    candidate = (STATIC_ROOT / clean.lstrip("/")).resolve()
-    try:
-        candidate.relative_to(STATIC_ROOT.resolve())
-    except ValueError:
+    candidate = os.path.abspath(os.path.join(_STATIC_ROOT_PREFIX, clean.lstrip("/")))
+    if not candidate.startswith(_STATIC_ROOT_PREFIX):
         raise web.HTTPForbidden()
-    if not candidate.is_file():
+    asset = Path(candidate)
+    if not asset.is_file():
         raise web.HTTPNotFound()
-    return candidate
+    return asset
+
+
+# Signatures are valid for 12 hours, so reusing them for a minute per refresh
+# token is safe and spares a dozen HMACs on every dashboard navigation.
+_SIGNED_PATHS_TTL_SECONDS = 60.0
+_SIGNED_PATHS_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
 
 
 def _signed_paths_for_request(
@@ -1967,9 +2037,14 @@ def _signed_paths_for_request(
     if not refresh_id:
         return {}
 
+    now = time.monotonic()
+    cached = _SIGNED_PATHS_CACHE.get(refresh_id)
+    if cached is not None and now - cached[0] < _SIGNED_PATHS_TTL_SECONDS:
+        return cached[1]
+
     signed: Dict[str, str] = {}
 
-    for key, path in SIGNED_API_PATHS.items():
+    for key, path in _SIGNED_API_PATH_ITEMS:
         try:
             signed[key] = async_sign_path(
                 hass,
@@ -1980,11 +2055,40 @@ def _signed_paths_for_request(
         except Exception as err:  # pragma: no cover - best effort
             _LOGGER.debug("Failed to sign %s for Akuvox UI: %s", path, err)
 
+    if len(signed) == len(_SIGNED_API_PATH_ITEMS):
+        for stale in [
+            token
+            for token, (stamp, _paths) in _SIGNED_PATHS_CACHE.items()
+            if now - stamp >= _SIGNED_PATHS_TTL_SECONDS
+        ]:
+            _SIGNED_PATHS_CACHE.pop(stale, None)
+        _SIGNED_PATHS_CACHE[refresh_id] = (now, signed)
+
     return signed
 
 
+# Dashboard pages keyed by file path, with their script insertion offset.
+# Bundled assets only change on upgrade; register_ui clears this on setup.
+_DASHBOARD_TEMPLATES: Dict[str, Tuple[str, int]] = {}
+
+
+def _signed_paths_insert_at(html: str) -> int:
+    match = _INJECT_POINT_RE.search(html)
+    if not match:
+        return 0
+    if match.lastgroup == "head":
+        return match.start()
+    # A stray </head> after <body> still wins, as it always has.
+    late_head = _HEAD_CLOSE_RE.search(html, match.end())
+    return late_head.start() if late_head else match.end()
+
+
 def _inject_signed_paths(
-    html: str, signed: Dict[str, str], *, clear_cache: bool = False
+    html: str,
+    signed: Dict[str, str],
+    *,
+    clear_cache: bool = False,
+    insert_at: Optional[int] = None,
 ) -> str:
     payload = "{}"
     if signed:
@@ -1992,10 +2096,7 @@ def _inject_signed_paths(
             payload = json.dumps(signed)
         except Exception:  # pragma: no cover - shouldn't happen
             payload = "{}"
-    try:
-        api_paths_payload = json.dumps(SIGNED_API_PATHS)
-    except Exception:  # pragma: no cover - shouldn't happen
-        api_paths_payload = "{}"
+    api_paths_payload = _SIGNED_API_PATHS_JSON
 
     script = (
         "<script>"
@@ -2218,19 +2319,9 @@ def _inject_signed_paths(
         ),
     )
 
-    lowered = html.lower()
-    head_index = lowered.find("</head>")
-    if head_index != -1:
-        return html[:head_index] + script + html[head_index:]
-
-    body_index = lowered.find("<body")
-    if body_index != -1:
-        insert_at = lowered.find(">", body_index)
-        if insert_at != -1:
-            insert_at += 1
-            return html[:insert_at] + script + html[insert_at:]
-
-    return script + html
+    if insert_at is None:
+        insert_at = _signed_paths_insert_at(html)
+    return html[:insert_at] + script + html[insert_at:]
 
 
 def _only_hhmm(v: Optional[str]) -> str:
@@ -2258,35 +2349,39 @@ def _ha_id_from_int(n: int) -> str:
     return ha_id_from_int(n)
 
 
-_BOOLISH_TRUE = {
-    "1",
-    "true",
-    "t",
-    "yes",
-    "y",
-    "on",
-    "enable",
-    "enabled",
-    "active",
-    "present",
-    "available",
-    "linked",
-}
+_BOOLISH_TRUE = frozenset(
+    {
+        "1",
+        "true",
+        "t",
+        "yes",
+        "y",
+        "on",
+        "enable",
+        "enabled",
+        "active",
+        "present",
+        "available",
+        "linked",
+    }
+)
 
-_BOOLISH_FALSE = {
-    "0",
-    "false",
-    "f",
-    "no",
-    "n",
-    "off",
-    "disable",
-    "disabled",
-    "inactive",
-    "absent",
-    "missing",
-    "unlinked",
-}
+_BOOLISH_FALSE = frozenset(
+    {
+        "0",
+        "false",
+        "f",
+        "no",
+        "n",
+        "off",
+        "disable",
+        "disabled",
+        "inactive",
+        "absent",
+        "missing",
+        "unlinked",
+    }
+)
 
 _FACE_FLAG_KEYS = (
     "face_active",
@@ -2313,10 +2408,7 @@ _FACE_FLAG_KEYS = (
 
 
 def _normalize_boolish(value: Any) -> Optional[bool]:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
+    # Device records carry strings far more often than native bools or numbers.
     if isinstance(value, str):
         lower = value.strip().lower()
         if not lower:
@@ -2325,6 +2417,11 @@ def _normalize_boolish(value: Any) -> Optional[bool]:
             return True
         if lower in _BOOLISH_FALSE:
             return False
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
     return None
 
 
@@ -2400,19 +2497,24 @@ def _device_supports_face(record: Mapping[str, Any]) -> bool:
     return device_type == "intercom"
 
 
-def _device_face_is_active(record: Mapping[str, Any]) -> bool:
-    url = str(
+_INACTIVE_FACE_STATUSES = frozenset({"pending", "0", "false", "inactive", "waiting"})
+
+
+def _record_face_url(record: Mapping[str, Any]) -> str:
+    return str(
         record.get("FaceUrl")
         or record.get("FaceURL")
         or record.get("face_url")
         or ""
     ).strip()
 
+
+def _device_face_is_active(record: Mapping[str, Any]) -> bool:
     flag = _face_flag_from_record(record)
     if flag is not None:
         return bool(flag)
 
-    if not url:
+    if not _record_face_url(record):
         return False
 
     status = str(
@@ -2422,19 +2524,14 @@ def _device_face_is_active(record: Mapping[str, Any]) -> bool:
         or record.get("Status")
         or ""
     ).strip().lower()
-    if status in ("pending", "0", "false", "inactive", "waiting"):
+    if status in _INACTIVE_FACE_STATUSES:
         return False
 
     return True
 
 
 def _device_face_registration_mismatch(record: Mapping[str, Any]) -> bool:
-    url = str(
-        record.get("FaceUrl")
-        or record.get("FaceURL")
-        or record.get("face_url")
-        or ""
-    ).strip()
+    url = _record_face_url(record)
     if not url:
         return False
     if _face_reference_is_remote_url(url):
@@ -2443,28 +2540,52 @@ def _device_face_registration_mismatch(record: Mapping[str, Any]) -> bool:
     return flag is False
 
 
+def _face_device_lookups(
+    devices: List[Dict[str, Any]],
+) -> List[Tuple[set[str], Dict[str, Any]]]:
+    """Return each device's sync group tokens and first user record per id."""
+    lookups: List[Tuple[set[str], Dict[str, Any]]] = []
+    for dev in devices:
+        user_index: Dict[str, Any] = {}
+        for candidate in dev.get("_users") or dev.get("users") or []:
+            candidate_key = normalize_user_id(_user_key(candidate)) or _user_key(candidate)
+            user_index.setdefault(candidate_key, candidate)
+        lookups.append((_group_tokens(dev.get("sync_groups")), user_index))
+    return lookups
+
+
 def _evaluate_face_status(
     hass: HomeAssistant,
     user: Mapping[str, Any],
     devices: List[Dict[str, Any]],
     stored_status: str,
+    face_index: Optional[Set[str]] = None,
+    device_lookups: Optional[List[Tuple[set[str], Dict[str, Any]]]] = None,
 ) -> str:
     user_id = str(user.get("id") or "").strip()
     if not user_id:
         return "none"
 
-    has_face_asset = _face_image_exists(hass, user_id)
-    wants_face = stored_status in {"pending", "active", "error"} or has_face_asset
-    if not wants_face:
-        return "none"
+    # A tracked face status already implies a face, so only probe the
+    # filesystem when nothing is stored.
+    if stored_status not in {"pending", "active", "error"}:
+        if face_index is not None:
+            has_face_asset = user_id in face_index
+        else:
+            has_face_asset = _face_image_exists(hass, user_id)
+        if not has_face_asset:
+            return "none"
 
     user_groups = user.get("groups") or []
+    user_tokens = _group_tokens(user_groups)
+    if device_lookups is None:
+        device_lookups = _face_device_lookups(devices)
     relevant_devices = [
-        dev
-        for dev in devices
+        (dev, user_index)
+        for dev, (dev_tokens, user_index) in zip(devices, device_lookups)
         if dev.get("participate_in_sync", True)
         and _device_supports_face(dev)
-        and _groups_overlap(user_groups, dev.get("sync_groups"))
+        and not user_tokens.isdisjoint(dev_tokens)
     ]
 
     if not relevant_devices:
@@ -2476,13 +2597,8 @@ def _evaluate_face_status(
         return "active"
 
     observed: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = []
-    for dev in relevant_devices:
-        record = None
-        for candidate in dev.get("_users") or dev.get("users") or []:
-            candidate_key = normalize_user_id(_user_key(candidate)) or _user_key(candidate)
-            if candidate_key == user_id:
-                record = candidate
-                break
+    for dev, user_index in relevant_devices:
+        record = user_index.get(user_id)
         if record is not None and _device_face_registration_mismatch(record):
             _LOGGER.debug(
                 "Face status user=%s -> error (device=%s register mismatch)",
@@ -2540,6 +2656,10 @@ async def _refresh_face_statuses(
         return
 
     profile_lookup = profiles or {}
+    face_index = _build_face_index(hass)
+    device_lookups = _face_device_lookups(devices)
+    pending_updates: List[Tuple[str, Dict[str, Any]]] = []
+    updated_profiles: Dict[str, Dict[str, Any]] = {}
     for entry in registry_users:
         user_id = normalize_user_id(entry.get("id"))
         if not user_id:
@@ -2551,7 +2671,9 @@ async def _refresh_face_statuses(
         stored_synced_at = stored.get("face_synced_at")
         stored_retry_after = stored.get("face_retry_after")
 
-        desired_status = _evaluate_face_status(hass, entry, devices, stored_status)
+        desired_status = _evaluate_face_status(
+            hass, entry, devices, stored_status, face_index, device_lookups
+        )
 
         if desired_status == "active":
             if stored_status != "active" or not stored_synced_at:
@@ -2583,30 +2705,41 @@ async def _refresh_face_statuses(
             or clear_errors
             or clear_retry_after
         ):
-            try:
-                await users_store.upsert_profile(
+            pending_updates.append(
+                (
                     user_id,
-                    face_status=status_for_store,
-                    face_synced_at=desired_synced_at or "",
-                    face_error_count=0 if clear_errors else None,
-                    face_retry_after="" if clear_retry_after else None,
+                    {
+                        "face_status": status_for_store,
+                        "face_synced_at": desired_synced_at or "",
+                        "face_error_count": 0 if clear_errors else None,
+                        "face_retry_after": "" if clear_retry_after else None,
+                    },
                 )
-                updated = dict(stored)
-                if status_for_store:
-                    updated["face_status"] = status_for_store
-                else:
-                    updated.pop("face_status", None)
-                if desired_synced_at:
-                    updated["face_synced_at"] = desired_synced_at
-                else:
-                    updated.pop("face_synced_at", None)
-                if clear_errors:
-                    updated.pop("face_error_count", None)
-                if clear_retry_after:
-                    updated.pop("face_retry_after", None)
-                profile_lookup[user_id] = updated
-            except Exception:
-                pass
+            )
+            updated = dict(stored)
+            if status_for_store:
+                updated["face_status"] = status_for_store
+            else:
+                updated.pop("face_status", None)
+            if desired_synced_at:
+                updated["face_synced_at"] = desired_synced_at
+            else:
+                updated.pop("face_synced_at", None)
+            if clear_errors:
+                updated.pop("face_error_count", None)
+            if clear_retry_after:
+                updated.pop("face_retry_after", None)
+            updated_profiles[user_id] = updated
+
+    if not pending_updates:
+        return
+    try:
+        applied = await users_store.upsert_profiles(pending_updates)
+    except Exception:
+        return
+    for user_id in applied:
+        if user_id in updated_profiles:
+            profile_lookup[user_id] = updated_profiles[user_id]
 def _context_user_name(hass: HomeAssistant, context) -> str:
     """Return a friendly name for the user behind an HTTP/service call."""
 
@@ -3304,8 +3437,19 @@ def _best_name(coord, entry_bucket: Dict[str, Any]) -> str:
         return "Akuvox Device"
 
 
+_NOW_ISO_CACHE: Tuple[int, str] = (0, "")
+
+
 def _now_iso() -> str:
-    return dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # Second resolution, so reuse the string until the clock ticks over.
+    global _NOW_ISO_CACHE
+    now = int(time.time())
+    cached_second, cached_text = _NOW_ISO_CACHE
+    if cached_second == now:
+        return cached_text
+    text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    _NOW_ISO_CACHE = (now, text)
+    return text
 
 
 def _now_local_iso() -> str:
@@ -3686,6 +3830,8 @@ def _serialize_devices(root: Dict[str, Any]) -> tuple[List[Dict[str, Any]], bool
             opts[CONF_RELAY_ROLES] = relay_roles
         except Exception:
             pass
+        # "_users" and "users" are read-only views of the same snapshot.
+        device_users = list(getattr(coord, "users", []) or [])
 
         dev = {
             "entry_id": entry_id,
@@ -3701,8 +3847,8 @@ def _serialize_devices(root: Dict[str, Any]) -> tuple[List[Dict[str, Any]], bool
             "last_sync": health.get("last_sync", "—"),
             "last_checked": health.get("last_checked"),
             "events": list(getattr(coord, "events", []) or []),
-            "_users": list(getattr(coord, "users", []) or []),
-            "users": list(getattr(coord, "users", []) or []),
+            "_users": device_users,
+            "users": device_users,
             "exit_device": bool(opts.get("exit_device", False)),
             "participate_in_sync": bool(opts.get("participate_in_sync", True)),
             "sync_groups": list(opts.get("sync_groups") or ["Default"]),
@@ -3717,6 +3863,16 @@ def _serialize_devices(root: Dict[str, Any]) -> tuple[List[Dict[str, Any]], bool
     return devices, any_alarm
 
 
+def _any_device_alarm_capable(root: Dict[str, Any]) -> bool:
+    """Return whether any device has an alarm relay, without serialising devices."""
+    for _entry_id, _bucket, coord, opts in _iter_device_buckets(root):
+        health = getattr(coord, "health", {}) or {}
+        device_type_raw = str(health.get("device_type") or "").strip()
+        if relay_alarm_capable(_device_relay_roles(opts, device_type_raw)):
+            return True
+    return False
+
+
 def _next_health_check_eta(
     root: Dict[str, Any],
     *,
@@ -3774,12 +3930,12 @@ def _apply_face_error_sync_overrides(
         if not _device_supports_face(dev):
             continue
 
-        sync_groups = dev.get("sync_groups")
+        sync_tokens = _group_tokens(dev.get("sync_groups"))
         error_users = 0
         for user in registry_users:
             if str(user.get("face_status") or "").strip().lower() != "error":
                 continue
-            if not _groups_overlap(user.get("groups"), sync_groups):
+            if sync_tokens.isdisjoint(_group_tokens(user.get("groups"))):
                 continue
             error_users += 1
 
@@ -3792,6 +3948,49 @@ def _apply_face_error_sync_overrides(
 
 
 # ========================= STATE =========================
+def _stored_face_file(
+    hass: HomeAssistant, base: Path, candidate: Path, rel: str
+) -> Optional[Path]:
+    """Return the stored face to serve, migrating a legacy copy if needed."""
+    if candidate.is_file():
+        return candidate
+
+    legacy_candidate = _legacy_face_candidate(hass, rel)
+    if not legacy_candidate or not legacy_candidate.is_file():
+        return None
+    try:
+        base.mkdir(parents=True, exist_ok=True)
+        candidate.write_bytes(legacy_candidate.read_bytes())
+    except Exception:
+        return legacy_candidate
+    try:
+        legacy_candidate.unlink()
+    except Exception:
+        pass
+    return candidate
+
+
+def _mirror_bundled_face(hass: HomeAssistant, rel: str, asset: Path) -> None:
+    """Copy a face served from the bundled assets into persistent storage."""
+    try:
+        dest_dir = _persistent_face_dir(hass)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        dest = (dest_dir / rel).resolve()
+        dest.relative_to(dest_dir)
+        if not dest.exists():
+            legacy_candidate = _legacy_face_candidate(hass, rel)
+            if legacy_candidate and legacy_candidate.exists():
+                dest.write_bytes(legacy_candidate.read_bytes())
+                try:
+                    legacy_candidate.unlink()
+                except Exception:
+                    pass
+            elif asset.is_file() and asset != dest:
+                dest.write_bytes(asset.read_bytes())
+    except Exception:
+        pass
+
+
 class AkuvoxStaticAssets(HomeAssistantView):
     url = "/api/AK_AC/{path:.*}"
     name = "api:akuvox_ac:static"
@@ -3805,27 +4004,15 @@ class AkuvoxStaticAssets(HomeAssistantView):
             rel = clean[8:].lstrip("/")
             if rel:
                 base = _persistent_face_dir(hass)
-                candidate = (base / rel).resolve()
-                try:
-                    candidate.relative_to(base)
-                except ValueError:
+                prefix = os.path.join(str(base), "")
+                candidate_path = os.path.abspath(os.path.join(prefix, rel))
+                if not candidate_path.startswith(prefix):
                     raise web.HTTPForbidden()
-                if candidate.is_file():
-                    return web.FileResponse(candidate)
-
-                legacy_candidate = _legacy_face_candidate(hass, rel)
-                if legacy_candidate and legacy_candidate.is_file():
-                    try:
-                        base.mkdir(parents=True, exist_ok=True)
-                        candidate.write_bytes(legacy_candidate.read_bytes())
-                    except Exception:
-                        return web.FileResponse(legacy_candidate)
-                    else:
-                        try:
-                            legacy_candidate.unlink()
-                        except Exception:
-                            pass
-                        return web.FileResponse(candidate)
+                served = await hass.async_add_executor_job(
+                    _stored_face_file, hass, base, Path(candidate_path), rel
+                )
+                if served is not None:
+                    return web.FileResponse(served)
 
         asset = _static_asset(path)
         if not is_face_request and asset.suffix.lower() == ".html":
@@ -3840,23 +4027,7 @@ class AkuvoxStaticAssets(HomeAssistantView):
         if is_face_request:
             rel = clean[8:].lstrip("/")
             if rel:
-                try:
-                    dest_dir = _persistent_face_dir(hass)
-                    dest_dir.mkdir(parents=True, exist_ok=True)
-                    dest = (dest_dir / rel).resolve()
-                    dest.relative_to(dest_dir)
-                    if not dest.exists():
-                        legacy_candidate = _legacy_face_candidate(hass, rel)
-                        if legacy_candidate and legacy_candidate.exists():
-                            dest.write_bytes(legacy_candidate.read_bytes())
-                            try:
-                                legacy_candidate.unlink()
-                            except Exception:
-                                pass
-                        elif asset.is_file() and asset != dest:
-                            dest.write_bytes(asset.read_bytes())
-                except Exception:
-                    pass
+                await hass.async_add_executor_job(_mirror_bundled_face, hass, rel, asset)
         return web.FileResponse(asset)
 
 
@@ -3890,13 +4061,17 @@ class AkuvoxDashboardView(HomeAssistantView):
         variant = "mobile" if requested_mobile else "desktop"
         if asset.suffix.lower() == ".html":
             signed = _signed_paths_for_request(hass, request)
-            try:
-                html = await hass.async_add_executor_job(
-                    partial(asset.read_text, encoding="utf-8")
-                )
-            except Exception:
-                html = await hass.async_add_executor_job(asset.read_text)
-            html = _inject_signed_paths(html, signed)
+            template = _DASHBOARD_TEMPLATES.get(str(asset))
+            if template is None:
+                try:
+                    html = await hass.async_add_executor_job(
+                        partial(asset.read_text, encoding="utf-8")
+                    )
+                except Exception:
+                    html = await hass.async_add_executor_job(asset.read_text)
+                template = (html, _signed_paths_insert_at(html))
+                _DASHBOARD_TEMPLATES[str(asset)] = template
+            html = _inject_signed_paths(template[0], signed, insert_at=template[1])
             response = web.Response(text=html, content_type="text/html")
             response.headers["X-AK-AC-Variant"] = variant
             response.headers["Cache-Control"] = "no-store"
@@ -4093,6 +4268,7 @@ class AkuvoxUIView(HomeAssistantView):
                 except Exception:
                     all_users = {}
                 today = dt.date.today()
+                face_index = _build_face_index(hass)
                 for key, prof in all_users.items():
                     canonical = normalize_user_id(key)
                     if not canonical or _profile_is_empty_reserved(prof):
@@ -4114,7 +4290,7 @@ class AkuvoxUIView(HomeAssistantView):
                             "face_status": face_status,
                             "face_synced_at": face_synced_at,
                             "face_active": face_status == "active"
-                            or _face_image_exists(hass, canonical),
+                            or canonical in face_index,
                             "face_error_count": int(prof.get("face_error_count") or 0),
                             "phone": prof.get("phone") or "",
                             "status": prof.get("status") or "active",
@@ -4233,7 +4409,9 @@ class AkuvoxUIView(HomeAssistantView):
         except Exception as err:
             _LOGGER.debug("Failed to build Akuvox state payload: %s", err)
 
-        return web.json_response(response)
+        # HomeAssistantView.json encodes with Home Assistant's orjson helper,
+        # which matters for the largest payload the dashboard polls.
+        return self.json(response)
 
 
 class AkuvoxUISession(HomeAssistantView):
@@ -4840,9 +5018,8 @@ class AkuvoxUIAction(AkuvoxUIView):
                     except Exception:
                         pass
 
-                alarm_any = False
                 try:
-                    _, alarm_any = _serialize_devices(root)
+                    alarm_any = _any_device_alarm_capable(root)
                 except Exception:
                     alarm_any = False
 
@@ -4917,7 +5094,7 @@ class AkuvoxUIAction(AkuvoxUIView):
                 await api.user_delete_all()
                 if coord:
                     try:
-                        coord.users = []
+                        coord.set_users([])
                     except Exception:
                         pass
                 return web.json_response({"ok": True})
@@ -5407,7 +5584,9 @@ class AkuvoxUISettings(HomeAssistantView):
                 if not isinstance(data, dict):
                     continue
                 coord = data.get("coordinator")
-                if coord and hasattr(coord, "update_interval"):
+                if coord and hasattr(coord, "set_base_update_interval"):
+                    coord.set_base_update_interval(interval_td)
+                elif coord and hasattr(coord, "update_interval"):
                     coord.update_interval = interval_td
 
         if "access_event_limit" in payload:
@@ -7270,6 +7449,9 @@ class AkuvoxUIRemoteEnrol(HomeAssistantView):
 
 # ========================= REGISTER =========================
 def register_ui(hass: HomeAssistant) -> None:
+    _dashboard_asset_variant.cache_clear()
+    _static_asset.cache_clear()
+    _DASHBOARD_TEMPLATES.clear()
     hass.http.register_view(AkuvoxStaticAssets())
     hass.http.register_view(AkuvoxDashboardView())
     hass.http.register_view(AkuvoxUIView())
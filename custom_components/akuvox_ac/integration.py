@@ -1062,20 +1062,22 @@ def _face_sync_cooldown_stamps(*, now: Optional[datetime] = None) -> Tuple[str,
     return current.isoformat(), retry_after.isoformat()
 
 
-_BOOLISH_TRUE = {
-    "1",
-    "true",
-    "t",
-    "yes",
-    "y",
-    "on",
-    "enable",
-    "enabled",
-    "active",
-    "present",
-    "available",
-    "linked",
-}
+_BOOLISH_TRUE = frozenset(
+    {
+        "1",
+        "true",
+        "t",
+        "yes",
+        "y",
+        "on",
+        "enable",
+        "enabled",
+        "active",
+        "present",
+        "available",
+        "linked",
+    }
+)
 
 EXIT_PERMISSION_MATCH = "match"
 EXIT_PERMISSION_WORKING_DAYS = "working_days"
@@ -1128,20 +1130,22 @@ def _normalize_exit_permission(value: Any) -> Optional[str]:
 
     return None
 
-_BOOLISH_FALSE = {
-    "0",
-    "false",
-    "f",
-    "no",
-    "n",
-    "off",
-    "disable",
-    "disabled",
-    "inactive",
-    "absent",
-    "missing",
-    "unlinked",
-}
+_BOOLISH_FALSE = frozenset(
+    {
+        "0",
+        "false",
+        "f",
+        "no",
+        "n",
+        "off",
+        "disable",
+        "disabled",
+        "inactive",
+        "absent",
+        "missing",
+        "unlinked",
+    }
+)
 
 _FACE_FLAG_KEYS = (
     "face_active",
@@ -1168,10 +1172,7 @@ _FACE_FLAG_KEYS = (
 
 
 def _normalize_boolish(value: Any) -> Optional[bool]:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
+    # Device records carry strings far more often than native bools or numbers.
     if isinstance(value, str):
         lower = value.strip().lower()
         if not lower:
@@ -1180,6 +1181,11 @@ def _normalize_boolish(value: Any) -> Optional[bool]:
             return True
         if lower in _BOOLISH_FALSE:
             return False
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
     return None
 
 
@@ -2891,16 +2897,24 @@ class AkuvoxUsersStore(Store):
     def __init__(self, hass: HomeAssistant):
         super().__init__(hass, 1, USERS_STORAGE_KEY)
         self.data: Dict[str, Any] = {"users": {}}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever profiles are loaded, reserved or saved."""
+        return self._revision
 
     async def async_load(self):
         existing = await super().async_load()
         if existing and isinstance(existing.get("users"), dict):
             self.data = existing
+        self._revision += 1
         changed = self._normalize_user_ids()
         if changed:
             await self.async_save()
 
     async def async_save(self):
+        self._revision += 1
         await super().async_save(self.data)
 
     def _normalize_user_ids(self) -> bool:
@@ -2961,12 +2975,12 @@ class AkuvoxUsersStore(Store):
                 if canonical:
                     used.add(canonical)
 
+        # Probe on the numeric suffixes so only the free slot is formatted.
+        used_numbers = {int(canonical[2:]) for canonical in used}
         n = 1
-        while True:
-            candidate = _ha_id_from_int(n)
-            if candidate not in used:
-                return candidate
+        while n in used_numbers:
             n += 1
+        return _ha_id_from_int(n)
 
     def next_free_temp_id(self, *, blocked: Optional[List[str]] = None) -> str:
         used: set[str] = set()
@@ -2987,24 +3001,25 @@ class AkuvoxUsersStore(Store):
                 if canonical:
                     used.add(canonical)
 
+        used_numbers = {int(canonical[3:]) for canonical in used}
         n = 1
-        while True:
-            candidate = temp_id_from_int(n)
-            if candidate not in used:
-                return candidate
+        while n in used_numbers:
             n += 1
+        return temp_id_from_int(n)
 
     def reserve_id(self, ha_id: str):
         canonical = normalize_ha_id(ha_id)
         if not canonical:
             raise ValueError(f"Invalid HA id: {ha_id}")
         self.data["users"].setdefault(canonical, {})
+        self._revision += 1
 
     def reserve_temp_id(self, temp_id: str):
         canonical = normalize_temp_id(temp_id)
         if not canonical:
             raise ValueError(f"Invalid temporary id: {temp_id}")
         self.data["users"].setdefault(canonical, {})
+        self._revision += 1
 
     async def upsert_profile(
         self,
@@ -3041,6 +3056,7 @@ class AkuvoxUsersStore(Store):
         paused_schedule_name: Optional[str] = None,
         ha_user_id: Optional[str] = None,
         ha_user_name: Optional[str] = None,
+        save: bool = True,
     ):
         canonical = normalize_user_id(key) or str(key)
         u = self.data["users"].setdefault(canonical, {})
@@ -3210,7 +3226,26 @@ class AkuvoxUsersStore(Store):
                 u["ha_user_name"] = cleaned
             else:
                 u.pop("ha_user_name", None)
-        await self.async_save()
+        if save:
+            await self.async_save()
+
+    async def upsert_profiles(self, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Apply several profile updates and persist them with a single save.
+
+        A failing update is logged and skipped; the keys that were applied are
+        returned so callers can mirror only those.
+        """
+        applied: List[str] = []
+        for key, fields in updates:
+            try:
+                await self.upsert_profile(key, save=False, **fields)
+            except Exception as err:
+                _LOGGER.warning("Failed to update Akuvox user profile %s: %s", key, err)
+                continue
+            applied.append(key)
+        if applied:
+            await self.async_save()
+        return applied
 
     async def delete(self, key: str):
         raw = str(key or "").strip()
@@ -3819,6 +3854,11 @@ class AkuvoxSettingsStore(Store):
         await self.async_save()
 
     def targets_for_event(self, event_type: str, *, user_id: Optional[str] = None) -> List[str]:
+        # Most installs configure no alert targets; skip re-sanitising the
+        # empty mapping on every door event.
+        alerts = self.data.get("alerts")
+        if not isinstance(alerts, dict) or not alerts.get("targets"):
+            return []
         mapping = self.get_alert_targets()
         out: List[str] = []
         norm_user = _canonical_notify_user_id(user_id)
@@ -7516,7 +7556,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             interval = int(health_interval_override)
         except Exception:
             interval = int(cfg.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL))
-    coord.update_interval = timedelta(seconds=max(10, interval))
+    coord.set_base_update_interval(timedelta(seconds=max(10, interval)))
 
     initial_groups = list(cfg.get(CONF_DEVICE_GROUPS, ["Default"])) or ["Default"]
     exit_device = bool(cfg.get("exit_device", False))
@@ -8434,7 +8474,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         coord.health["device_type"] = new_device_type
         coord.health["device_model"] = new_device_model
         new_interval = int(new_cfg.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL))
-        coord.update_interval = timedelta(seconds=max(10, new_interval))
+        coord.set_base_update_interval(timedelta(seconds=max(10, new_interval)))
         new_groups = list(new_cfg.get(CONF_DEVICE_GROUPS, ["Default"])) or ["Default"]
         raw_roles = new_cfg.get(CONF_RELAY_ROLES)
         if not isinstance(raw_roles, dict):
@@ -8463,7 +8503,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         root = hass.data.get(DOMAIN, {})
-        root.pop(entry.entry_id, None)
+        bucket = root.pop(entry.entry_id, None)
+        coord = bucket.get("coordinator") if isinstance(bucket, dict) else None
+        if coord is not None and hasattr(coord, "async_shutdown"):
+            try:
+                await coord.async_shutdown()
+            except Exception as err:
+                _LOGGER.debug("Failed to shut down coordinator for %s: %s", entry.entry_id, err)
 
         only_special = all(
             k
@@ -1,4 +1,6 @@
 import asyncio
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 
 import pytest
@@ -7,9 +9,16 @@ from custom_components.akuvox_ac.ha_test_stubs import ensure_homeassistant_stubs
 
 ensure_homeassistant_stubs()
 
-from custom_components.akuvox_ac.access_history import AccessHistory
+from custom_components.akuvox_ac.access_history import AccessHistory, categorize_event
 from custom_components.akuvox_ac.const import DOMAIN
-from custom_components.akuvox_ac.coordinator import AkuvoxCoordinator, _derive_targets_from_raw
+from custom_components.akuvox_ac import coordinator as coordinator_module
+from custom_components.akuvox_ac.coordinator import (
+    EVENT_HISTORY_LIMIT,
+    OFFLINE_ALERT_DELAY_SECONDS,
+    AkuvoxCoordinator,
+    _derive_targets_from_raw,
+    _keyword_pattern,
+)
 
 
 class _StorageStub:
@@ -163,6 +172,112 @@ def test_health_refresh_caches_full_user_list_between_door_event_polls():
     assert event_polls == 2
 
 
+def test_health_refresh_overlaps_user_refresh_with_door_events_once_users_loaded():
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+    coord.users = [{"ID": "HA001", "Name": "Alice"}]
+    both_started = asyncio.Event()
+    started: List[str] = []
+
+    async def _mark(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+
+    async def _refresh_users(**_kwargs):
+        await _mark("users")
+        raise RuntimeError("user list unavailable")
+
+    async def _events(*_args, **_kwargs):
+        await _mark("events")
+        return []
+
+    coord.async_refresh_users = _refresh_users  # type: ignore[method-assign]
+    coord._process_door_events = _events  # type: ignore[method-assign]
+
+    asyncio.run(asyncio.wait_for(coord._async_update_data(), timeout=1))
+
+    assert sorted(started) == ["events", "users"]
+    assert coord.health["online"] is True
+
+
+def test_health_refresh_overlaps_ping_with_user_refresh_while_online():
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+    coord.users = [{"ID": "HA001", "Name": "Alice"}]
+    both_started = asyncio.Event()
+    started: List[str] = []
+
+    async def _mark(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+
+    async def _ping_info():
+        await _mark("ping")
+        return {"ok": True}
+
+    async def _refresh_users(**_kwargs):
+        await _mark("users")
+
+    coord.api.ping_info = _ping_info
+    coord.async_refresh_users = _refresh_users  # type: ignore[method-assign]
+
+    asyncio.run(asyncio.wait_for(coord._async_update_data(), timeout=1))
+
+    assert sorted(started) == ["ping", "users"]
+    assert coord.health["online"] is True
+
+
+def test_health_refresh_cancels_overlapped_user_refresh_when_device_is_down():
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+    coord.users = [{"ID": "HA001", "Name": "Alice"}]
+    coord._schedule_offline_alert = lambda _since: None  # type: ignore[method-assign]
+    cancelled: List[bool] = []
+
+    async def _ping_info():
+        await asyncio.sleep(0)
+        return {"ok": False}
+
+    async def _refresh_users(**_kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    coord.api.ping_info = _ping_info
+    coord.async_refresh_users = _refresh_users  # type: ignore[method-assign]
+
+    async def _run():
+        await coord._async_update_data()
+        await asyncio.sleep(0)
+
+    asyncio.run(asyncio.wait_for(_run(), timeout=1))
+
+    assert coord.health["online"] is False
+    assert cancelled == [True]
+
+
+def test_health_refresh_returns_equal_fingerprint_for_unchanged_ticks():
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+
+    first = asyncio.run(coord._async_update_data())
+    second = asyncio.run(coord._async_update_data())
+    assert first == second
+
+    coord.health["last_sync"] = "2026-01-08T08:30:00+00:00"
+    assert asyncio.run(coord._async_update_data()) != second
+
+
 def test_resolve_event_user_id_matches_profile_name_to_canonical_id():
     storage = _StorageStub()
     coord = _build_coordinator(_APIStub([]), storage)
@@ -330,6 +445,58 @@ def test_dispatch_notification_includes_access_method(event_type, expected_messa
     assert diag[0]["target"] == "mobile_app_elles_iphone"
 
 
+def test_dispatch_notification_resolves_access_method_once(monkeypatch):
+    storage = _StorageStub()
+    coord = _build_coordinator(_APIStub([]), storage)
+    coord.events = []
+    coord.hass.services = _ServiceStub()
+    calls: List[Any] = []
+    label = AkuvoxCoordinator._access_method_label
+
+    def _counting_label(event):
+        calls.append(event)
+        return label(event)
+
+    monkeypatch.setattr(AkuvoxCoordinator, "_access_method_label", staticmethod(_counting_label))
+
+    event = {"Event": "Door unlocked", "Type": "Face", "UserName": "Neil smalley"}
+    asyncio.run(coord._dispatch_notification(event, ["mobile_app_elles_iphone"]))
+
+    assert coord.hass.services.calls[0]["data"]["message"] == "Neil smalley opened the gate via Face."
+    assert len(calls) == 1
+
+
+def test_dispatch_notification_fires_targets_concurrently_in_order():
+    storage = _StorageStub()
+    coord = _build_coordinator(_APIStub([]), storage)
+    coord.events = []
+    started: List[str] = []
+    release = asyncio.Event()
+
+    class _ConcurrentServices:
+        async def async_call(self, domain, service, data, blocking=False):
+            started.append(service)
+            if len(started) == 2:
+                release.set()
+            await release.wait()
+            if service == "mobile_app_broken":
+                raise RuntimeError("push unavailable")
+
+    coord.hass.services = _ConcurrentServices()
+    event = {"Event": "Door unlocked", "UserName": "Neil smalley"}
+
+    asyncio.run(
+        asyncio.wait_for(
+            coord._dispatch_notification(event, ["mobile_app_broken", "mobile_app_elles_iphone"]),
+            timeout=1,
+        )
+    )
+
+    assert started == ["mobile_app_broken", "mobile_app_elles_iphone"]
+    assert coord.events[1]["Event"].startswith("System notification failed for broken —")
+    assert coord.events[0]["Event"].startswith("System notification sent to elles iphone —")
+
+
 def test_dispatch_notification_appends_system_event_on_failure():
     storage = _StorageStub()
     coord = _build_coordinator(_APIStub([]), storage)
@@ -352,6 +519,24 @@ def test_dispatch_notification_appends_system_event_on_failure():
     assert diag[0]["error"] == "push unavailable"
 
 
+def test_dispatch_notification_treats_cancelled_call_as_failure():
+    storage = _StorageStub()
+    coord = _build_coordinator(_APIStub([]), storage)
+    coord.events = []
+
+    class _CancelledServices:
+        async def async_call(self, domain, service, data, blocking=False):
+            raise asyncio.CancelledError
+
+    coord.hass.services = _CancelledServices()
+    event = {"Event": "Door unlocked", "UserName": "Neil smalley"}
+
+    asyncio.run(coord._dispatch_notification(event, ["mobile_app_elles_iphone"]))
+
+    assert coord.events[0]["Event"].startswith("System notification failed for elles iphone")
+    assert storage.data["notification_diagnostics"][0]["status"] == "failed"
+
+
 @pytest.mark.parametrize(
     ("event", "expected_message"),
     [
@@ -575,7 +760,586 @@ def test_process_door_events_updates_state_with_newer_events():
     assert [event["ID"] for event in handled] == ["evt-new"]
     assert storage.saved is True
 
-    last_epoch = storage.data["door_events"]["last_event_epoch"]
+    last_key, last_epoch = storage.data["door_events"]["watermark"]
     expected_epoch = AccessHistory._coerce_timestamp("2024-04-10T13:45:00")
     assert pytest.approx(last_epoch, rel=1e-6) == expected_epoch
-    assert storage.data["door_events"]["last_event_key"] == "evt-new"
+    assert last_key == "evt-new"
+    assert "last_event_key" not in storage.data["door_events"]
+    assert "last_event_epoch" not in storage.data["door_events"]
+
+
+def test_event_unique_key_falls_back_to_short_stable_digest():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+
+    first = coord._event_unique_key({"Door": "Front", "Reader": 2})
+    second = coord._event_unique_key({"Reader": 2, "Door": "Front"})
+
+    assert first == second
+    assert len(first) == 16
+    assert first != coord._event_unique_key({"Door": "Back", "Reader": 2})
+
+
+def test_append_event_keeps_bounded_newest_first_history():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    coord.events = []
+
+    for index in range(EVENT_HISTORY_LIMIT + 5):
+        coord._append_event(f"event {index}")
+
+    assert len(coord.events) == EVENT_HISTORY_LIMIT
+    assert coord.events[0]["Event"] == f"event {EVENT_HISTORY_LIMIT + 4}"
+    assert coord.events[-1]["Event"] == "event 5"
+
+
+def test_keyword_pattern_drops_keywords_covered_by_shorter_ones():
+    pattern = _keyword_pattern(("granted", "grant", "succ", "success", "open", "opened"))
+
+    assert sorted(pattern.pattern.split("|")) == ["grant", "open", "succ"]
+    assert pattern.search("door opened successfully") is not None
+    assert pattern.search("doorbell") is None
+
+
+@pytest.mark.parametrize(
+    ("event", "denied", "granted", "non_key"),
+    [
+        ({"Event": "Door Unlocked", "Type": "Face"}, False, True, True),
+        ({"Event": "AccessGranted", "Type": "Card"}, False, True, False),
+        ({"Event": "Access denied", "Type": "PIN"}, True, False, False),
+        ({"Event": "Unlock failed", "Type": "Face"}, True, False, True),
+        ({"Event": "Doorbell", "Type": "Call"}, False, False, False),
+    ],
+)
+def test_event_keyword_classification(event, denied, granted, non_key):
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    tokens = coord._event_summary_tokens(event)
+
+    assert coord._event_is_access_denied(tokens) is denied
+    assert coord._event_is_access_granted(tokens) is granted
+    assert coord._is_non_key_access(event) is non_key
+
+
+def test_process_door_events_returns_early_when_newest_event_already_seen():
+    storage = _StorageStub()
+    storage.data["door_events"]["last_event_key"] = "evt-new"
+
+    events = [
+        {"ID": "evt-new", "Date": "2024-04-10", "Time": "13:45:00"},
+        {"ID": "evt-old", "Date": "2024-04-09", "Time": "08:00:00"},
+    ]
+    coord = _build_coordinator(_APIStub(events), storage)
+    published: List[List[Dict[str, Any]]] = []
+    coord._publish_access_history = published.append  # type: ignore[method-assign]
+
+    async def _handle(event, _targets):
+        raise AssertionError("already handled events must not be replayed")
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    result = asyncio.run(coord._process_door_events())
+
+    assert result == events
+    assert published == []
+    assert storage.saved is False
+
+
+def test_process_door_events_publishes_only_rows_newer_than_watermark():
+    storage = _StorageStub()
+    storage.data["door_events"]["watermark"] = ["evt-old", 0.0]
+
+    events = [
+        {"ID": "evt-new", "Date": "2024-04-10", "Time": "13:45:00"},
+        {"ID": "evt-old", "Date": "2024-04-09", "Time": "08:00:00"},
+    ]
+    coord = _build_coordinator(_APIStub(events), storage)
+    published: List[List[Dict[str, Any]]] = []
+    coord._publish_access_history = published.append  # type: ignore[method-assign]
+
+    async def _handle(_event, _targets):
+        return False
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    asyncio.run(coord._process_door_events())
+
+    assert [[event["ID"] for event in batch] for batch in published] == [["evt-new"]]
+
+
+def test_process_door_events_skips_reordered_events_already_handled():
+    storage = _StorageStub()
+    api = _APIStub([{"ID": "evt-2", "Event": "Door unlocked"}, {"ID": "evt-1", "Event": "Door unlocked"}])
+    coord = _build_coordinator(api, storage)
+
+    handled: List[str] = []
+
+    async def _handle(event, _targets):
+        handled.append(event["ID"])
+        return False
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    asyncio.run(coord._process_door_events())
+    api._events = [{"ID": "evt-1", "Event": "Door unlocked"}, {"ID": "evt-2", "Event": "Door unlocked"}]
+    asyncio.run(coord._process_door_events())
+
+    assert handled == ["evt-1", "evt-2"]
+    assert storage.data["door_events"]["watermark"][0] == "evt-2"
+
+
+def test_process_door_events_handles_reused_ids_with_newer_timestamps():
+    storage = _StorageStub()
+    api = _APIStub(
+        [
+            {"ID": "2", "Event": "Door unlocked", "Date": "2024-04-10", "Time": "10:00:00"},
+            {"ID": "1", "Event": "Door unlocked", "Date": "2024-04-10", "Time": "09:00:00"},
+        ]
+    )
+    coord = _build_coordinator(api, storage)
+    handled: List[str] = []
+
+    async def _handle(event, _targets):
+        handled.append(f"{event['ID']}@{event['Time']}")
+        return False
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    asyncio.run(coord._process_door_events())
+    # The device cleared its log and started numbering from 1 again.
+    api._events = [{"ID": "1", "Event": "Door unlocked", "Date": "2024-04-11", "Time": "08:00:00"}]
+    asyncio.run(coord._process_door_events())
+    asyncio.run(coord._process_door_events())
+
+    assert handled == ["1@09:00:00", "2@10:00:00", "1@08:00:00"]
+
+
+def test_door_event_without_verdict_updates_last_accessed_listeners():
+    storage = _StorageStub()
+    coord = _build_coordinator(_APIStub([]), storage)
+    coord.users = [{"UserID": "HA001", "Name": "Alice"}]
+    updates: List[int] = []
+    coord.async_update_listeners = lambda: updates.append(1)  # type: ignore[method-assign]
+    event = {
+        "Event": "Door closed",
+        "UserID": "HA001",
+        "Date": "2024-04-10",
+        "Time": "09:00:00",
+    }
+
+    changed = asyncio.run(coord._handle_door_event(event, []))
+
+    assert changed is True
+    assert updates == [1]
+    snapshot = coord.get_last_access_snapshot()
+    assert snapshot["user_id"] == "HA001"
+    assert snapshot["user_name"] == "Alice"
+
+    coord.set_users([{"UserID": "HA001", "Name": "Alice Smith"}])
+    assert updates == [1, 1]
+    assert coord.get_last_access_snapshot()["user_name"] == "Alice Smith"
+
+    coord.set_users([{"UserID": "HA001", "Name": "Alice Smith"}])
+    assert updates == [1, 1]
+
+
+def test_process_door_events_updates_listeners_once_per_batch():
+    storage = _StorageStub()
+    events = [{"ID": f"evt-{index}", "Event": "Door unlocked"} for index in range(3)]
+    coord = _build_coordinator(_APIStub(events), storage)
+    updates: List[int] = []
+    coord.async_update_listeners = lambda: updates.append(1)  # type: ignore[method-assign]
+
+    async def _handle(_event, _targets):
+        coord._notify_listeners()
+        return False
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    asyncio.run(coord._process_door_events())
+
+    assert updates == [1]
+
+    coord._notify_listeners()
+    assert updates == [1, 1]
+
+
+def test_notify_listeners_coalesces_within_one_loop_turn():
+    storage = _StorageStub()
+    coord = _build_coordinator(_APIStub([]), storage)
+    updates: List[int] = []
+    coord.async_update_listeners = lambda: updates.append(1)  # type: ignore[method-assign]
+    scheduled: List[Any] = []
+    coord.hass.loop = type("L", (), {"call_soon": lambda self, cb: scheduled.append(cb)})()
+
+    for _ in range(5):
+        coord._notify_listeners()
+
+    assert updates == []
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+    assert updates == [1]
+
+    coord._notify_listeners()
+    assert len(scheduled) == 1
+
+
+def test_domain_root_is_cached_once_populated():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+
+    assert coord._domain_root() == {}
+
+    root = {"sync_queue": object()}
+    coord.hass.data[DOMAIN] = root
+    assert coord._domain_root() is root
+
+    coord.hass.data = {}
+    assert coord._domain_root() is root
+
+
+def test_health_refresh_writes_storage_once_per_tick():
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+    saves: List[int] = []
+
+    async def _count_save() -> None:
+        saves.append(1)
+
+    coord.storage.async_save = _count_save  # type: ignore[method-assign]
+
+    async def _dirty_event_poll(*_args, **_kwargs):
+        await coord._async_save_storage("door event state")
+        await coord._async_save_notification_diagnostics()
+        return []
+
+    coord._process_door_events = _dirty_event_poll  # type: ignore[method-assign]
+
+    asyncio.run(coord._async_update_data())
+
+    assert saves == [1]
+
+
+def test_prepare_access_history_events_orders_newest_first_and_keeps_device_fields():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    coord.health = {}
+
+    prepared = coord._prepare_access_history_events(
+        [
+            {"ID": "evt-old", "Date": "2024-04-09", "Time": "09:15:00"},
+            {"ID": "evt-new", "Date": "2024-04-10", "Time": "12:00:00", "Result": "Denied"},
+            "not-an-event",
+        ]
+    )
+
+    assert [event["ID"] for event in prepared] == ["evt-new", "evt-old"]
+    assert prepared[0]["Time"] == "12:00:00"
+    assert prepared[0]["timestamp"] == "2024-04-10 12:00:00"
+    assert prepared[0]["Result"] == "Denied"
+    assert prepared[0]["_key"] == "device-1:evt-new"
+    assert prepared[0]["_source"] == "doorlog"
+
+
+def test_prepare_access_history_events_skips_rows_history_already_holds():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    coord.health = {}
+    history = AccessHistory()
+    history.ingest([{"_key": "device-1:evt-old", "_t": 1.0}], 10)
+
+    prepared = coord._prepare_access_history_events(
+        [
+            {"ID": "evt-new", "Date": "2024-04-10", "Time": "12:00:00"},
+            {"ID": "evt-old", "Date": "2024-04-09", "Time": "09:15:00"},
+        ],
+        history,
+    )
+
+    assert "device-1:evt-old" in history
+    assert [event["ID"] for event in prepared] == ["evt-new"]
+
+
+def test_publish_access_history_skips_preparation_when_storage_limit_is_zero():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    del coord._publish_access_history
+    settings = type("S", (), {"get_access_history_storage_limit": lambda self: 0})()
+    coord.hass.data = {DOMAIN: {"access_history": AccessHistory(), "settings_store": settings}}
+
+    def _prepare(*_args, **_kwargs):
+        raise AssertionError("history rows must not be prepared when history is disabled")
+
+    coord._prepare_access_history_events = _prepare  # type: ignore[method-assign]
+
+    coord._publish_access_history([{"ID": "evt-1", "Event": "Door unlocked"}])
+
+
+def test_offline_alert_is_sent_once_by_timer_and_cancelled_on_recovery(monkeypatch):
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord._was_online = True
+    coord.storage.data["alerts_state"] = {}
+    timers: List[Any] = []
+    cancelled: List[Any] = []
+
+    def _call_later(_hass, delay, action):
+        timers.append((delay, action))
+        return lambda: cancelled.append(delay)
+
+    monkeypatch.setattr(coordinator_module, "async_call_later", _call_later)
+    sent: List[str] = []
+
+    async def _send(event_type, **_kwargs):
+        sent.append(event_type)
+
+    coord._send_alert_notification = _send  # type: ignore[method-assign]
+
+    async def _offline_ping():
+        return {"ok": False}
+
+    coord.api.ping_info = _offline_ping  # type: ignore[method-assign]
+    asyncio.run(coord._async_update_data())
+    asyncio.run(coord._async_update_data())
+
+    assert len(timers) == 1
+    assert 0 < timers[0][0] <= OFFLINE_ALERT_DELAY_SECONDS
+
+    tasks: List[Any] = []
+    coord.hass.async_create_task = tasks.append
+    timers[0][1](None)
+    asyncio.run(tasks[0])
+    asyncio.run(coord._async_send_offline_alert())
+
+    assert sent == ["device_offline"]
+    assert coord.storage.data["alerts_state"]["offline_notified"] is True
+
+    asyncio.run(coord._async_update_data())
+    assert len(timers) == 1
+
+    # A fresh outage arms a new timer, which recovery cancels before it fires.
+    coord.storage.data["alerts_state"] = {}
+    asyncio.run(coord._async_update_data())
+    assert len(timers) == 2
+
+    async def _online_ping():
+        return {"ok": True}
+
+    coord.api.ping_info = _online_ping  # type: ignore[method-assign]
+    asyncio.run(coord._async_update_data())
+
+    assert cancelled == [timers[1][0]]
+    assert coord.storage.data["alerts_state"]["offline_since"] is None
+
+
+def test_unload_cancels_pending_offline_alert(monkeypatch):
+    from types import SimpleNamespace
+
+    from custom_components.akuvox_ac import integration as integration_module
+
+    queue = _SyncQueueStub()
+    coord = _build_health_coordinator(queue)
+    coord.storage.data["alerts_state"] = {"offline_since": time.time() - 60}
+    timers: List[Any] = []
+    cancelled: List[Any] = []
+
+    def _call_later(_hass, delay, action):
+        timers.append(action)
+        return lambda: cancelled.append(delay)
+
+    monkeypatch.setattr(coordinator_module, "async_call_later", _call_later)
+    sent: List[str] = []
+
+    async def _send(event_type, **_kwargs):
+        sent.append(event_type)
+
+    coord._send_alert_notification = _send  # type: ignore[method-assign]
+    coord._schedule_offline_alert(time.time() - 60)
+
+    async def _unload_platforms(_entry, _platforms):
+        return True
+
+    hass = SimpleNamespace(
+        data={DOMAIN: {"device-1": {"coordinator": coord}, "sync_queue": queue}},
+        config_entries=SimpleNamespace(async_unload_platforms=_unload_platforms),
+    )
+    entry = SimpleNamespace(entry_id="device-1")
+
+    assert asyncio.run(integration_module.async_unload_entry(hass, entry)) is True
+    assert len(timers) == 1 and len(cancelled) == 1
+    assert coord._offline_alert_handle is None
+
+    # Even a callback that raced the unload must not alert for the old entry.
+    asyncio.run(coord._async_send_offline_alert())
+    assert sent == []
+    assert "offline_notified" not in coord.storage.data["alerts_state"]
+
+
+def test_update_interval_adapts_to_activity_and_keeps_configured_baseline():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    coord.health = {"online": True}
+    coord.update_interval = timedelta(seconds=30)
+
+    coord._adapt_update_interval(had_new_events=True, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=10)
+
+    coord._adapt_update_interval(had_new_events=False, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=30)
+
+    coord.health = {"online": False}
+    coord._adapt_update_interval(had_new_events=False, offline_since=time.time() - 60)
+    assert coord.update_interval == timedelta(seconds=30)
+    coord._adapt_update_interval(had_new_events=False, offline_since=time.time() - 360)
+    assert coord.update_interval == timedelta(seconds=60)
+    coord._adapt_update_interval(had_new_events=False, offline_since=time.time() - 600)
+    assert coord.update_interval == timedelta(seconds=120)
+    coord._adapt_update_interval(had_new_events=False, offline_since=time.time() - 3600)
+    assert coord.update_interval == timedelta(seconds=300)
+
+    # A user-configured interval replaces the baseline the adaptation returns to.
+    coord.set_base_update_interval(timedelta(seconds=45))
+    coord.health = {"online": True}
+    coord._adapt_update_interval(had_new_events=False, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=45)
+
+    # Configuring the value the adapter happens to have applied still counts.
+    coord._adapt_update_interval(had_new_events=True, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=10)
+    coord.set_base_update_interval(timedelta(seconds=10))
+    coord._adapt_update_interval(had_new_events=False, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=10)
+
+    # Direct writes by anything else no longer move the baseline.
+    coord.set_base_update_interval(timedelta(seconds=120))
+    coord.update_interval = timedelta(seconds=10)
+    coord._adapt_update_interval(had_new_events=False, offline_since=None)
+    assert coord.update_interval == timedelta(seconds=120)
+
+
+def test_extract_event_user_name_prefers_name_fields_over_ids():
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+
+    assert coord._extract_event_user_name({"ID": "7", "UserName": " Alice ", "Event": "x"}) == "Alice"
+    assert coord._extract_event_user_name({"Name": "", "CardNo": 1234}) == "1234"
+    assert coord._extract_event_user_name({"Event": "Door unlocked"}) is None
+
+
+def test_process_door_events_derives_event_facts_once_per_row():
+    events = [
+        {"ID": "evt-2", "Date": "2024-04-10", "Time": "12:00:00"},
+        {"ID": "evt-1", "Date": "2024-04-09", "Time": "09:15:00"},
+    ]
+    coord = _build_coordinator(_APIStub(events), _StorageStub())
+    del coord._publish_access_history
+    coord.health = {}
+    settings = type("S", (), {"get_access_history_retention_seconds": lambda self: 0})()
+    coord.hass.data = {DOMAIN: {"access_history": AccessHistory(), "settings_store": settings}}
+    extracted: List[str] = []
+    original = coord._extract_event_timestamp
+
+    def _counting_extract(event, **kwargs):
+        extracted.append(event["ID"])
+        return original(event, **kwargs)
+
+    coord._extract_event_timestamp = _counting_extract  # type: ignore[method-assign]
+
+    async def _handle(_event, _targets):
+        return False
+
+    coord._handle_door_event = _handle  # type: ignore[attr-defined]
+
+    asyncio.run(coord._process_door_events())
+
+    assert sorted(extracted) == ["evt-1", "evt-2"]
+    assert len(coord.hass.data[DOMAIN]["access_history"].snapshot()) == 2
+    assert coord._event_facts_memo is None
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        ({"Type": "DTMF"}, "call"),
+        ({"Event": "Door unlocked", "CallNo": "101"}, "call"),
+        ({"Event": "Incoming call"}, "call"),
+        ({"Event": "Device went offline"}, "system"),
+        ({"Event": "Access granted", "UserName": "Alice"}, "access"),
+        ({"Event": 42}, "system"),
+    ],
+)
+def test_categorize_event_groups_door_log_rows(event, expected):
+    assert categorize_event(event) == expected
+
+
+def test_fetch_current_caller_picks_freshest_received_call_across_timezones():
+    now = time.time()
+
+    class _CallLogAPI:
+        async def call_log(self):
+            return [
+                {"ID": "1", "Type": "Received", "Number": "0400 111 222", "Timestamp": now - 50},
+                {"ID": "2", "Type": "Dialed", "Number": "0400 333 444", "Timestamp": now - 1},
+                {"ID": "3", "Type": "Received", "Number": "0400 555 666", "Timestamp": now - 5},
+                {"ID": "4", "Type": "Received", "Number": "0400 777 888", "Timestamp": now - 600},
+                {
+                    "ID": "5",
+                    "Type": "Received",
+                    "Number": "0400 999 000",
+                    "DateTime": datetime.fromtimestamp(now - 2, tz=timezone(timedelta(hours=10))).isoformat(),
+                },
+                "not-a-call",
+            ]
+
+    coord = _build_coordinator(_CallLogAPI(), _StorageStub())
+    published: List[Dict[str, Any]] = []
+    coord._set_caller_state = lambda state, auto_clear: published.append(state)  # type: ignore[method-assign]
+
+    state = asyncio.run(coord.async_fetch_current_caller())
+
+    assert state["call_id"] == "5"
+    assert state["digits"] == "0400999000"
+    assert state["status"] == "unmatched"
+    assert 0 <= state["age_seconds"] < 60
+    assert published == [state]
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        ({"KeyHolder": " Yes "}, True),
+        ({"key_holder": "off"}, False),
+        ({"key_holder": "maybe", "keyHolder": "1"}, True),
+        ({"KeyHolder": "unknown"}, None),
+        ({"KeyHolder": 0}, False),
+    ],
+)
+def test_extract_event_key_holder_parses_flag_words(event, expected):
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+
+    assert coord._extract_event_key_holder(event, user_id=None) is expected
+
+
+def test_resolve_event_user_id_reuses_registry_index_until_store_revision_changes():
+    class _RevisionedUsersStore(_UsersStoreStub):
+        def __init__(self, users):
+            super().__init__(users)
+            self.revision = 1
+            self.all_calls = 0
+
+        def all(self):
+            self.all_calls += 1
+            return super().all()
+
+    store = _RevisionedUsersStore(
+        {
+            "HA001": {"name": "Sam", "device_id": "9001"},
+            "HA002": {"name": "Alex", "card_code": "sam"},
+        }
+    )
+    coord = _build_coordinator(_APIStub([]), _StorageStub())
+    coord.users = []
+    coord.hass.data = {DOMAIN: {"users_store": store}}
+
+    assert coord._resolve_event_user_id({"UserName": "SAM"}) == "HA001"
+    assert coord._resolve_event_user_id({"UserID": "9001"}) == "HA001"
+    assert store.all_calls == 1
+
+    store._users["HA003"] = {"name": "Robin"}
+    store.revision = 2
+
+    assert coord._resolve_event_user_id({"Name": "robin"}) == "HA003"
+    assert store.all_calls == 2
@@ -1,4 +1,13 @@
-from custom_components.akuvox_ac.coordinator import AkuvoxCoordinator
+import re
+
+import pytest
+
+from custom_components.akuvox_ac.coordinator import (
+    AkuvoxCoordinator,
+    _event_text_to_epoch,
+    _is_time_only,
+    _now_iso,
+)
 
 
 def _make_coordinator_stub():
@@ -21,3 +30,51 @@ def test_extract_event_timestamp_prefers_combined_values():
     coord = _make_coordinator_stub()
     event = {"Date": "2025/11/06", "Time": "08:05:01"}
     assert coord._extract_event_timestamp(event, fallback=False) == "2025/11/06 08:05:01"
+
+
+def test_extract_event_timestamp_skips_placeholder_date_on_fast_path():
+    coord = _make_coordinator_stub()
+    event = {"Date": "--", "Time": "09:12:30"}
+    assert coord._extract_event_timestamp(event, fallback=False) == "09:12:30"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "8:05:01",
+        "08:05:01",
+        "08:05:01.250",
+        "108:05:01",
+        "08:5:01",
+        "08:05",
+        "08:05:01.",
+        "08:05:01.2a",
+        ":05:01",
+        "2025-11-06 08:05:01",
+        "08:05:01:00",
+        "²8:05:01",
+    ],
+)
+def test_is_time_only_matches_clock_pattern(value):
+    expected = re.fullmatch(r"\d{1,2}:\d{2}:\d{2}(?:\.\d+)?", value) is not None
+    assert _is_time_only(value) is expected
+
+
+def test_now_iso_uses_single_utc_designator():
+    value = _now_iso(None)
+    assert value.endswith("Z")
+    assert "+00:00" not in value
+    coord = _make_coordinator_stub()
+    assert coord._coerce_event_timestamp_to_epoch(value) > 0
+
+
+def test_coerce_event_timestamp_memoises_repeated_device_strings():
+    coord = _make_coordinator_stub()
+    _event_text_to_epoch.cache_clear()
+
+    first = coord._coerce_event_timestamp_to_epoch(" 2025/11/06 08:05:01 ")
+    second = coord._coerce_event_timestamp_to_epoch("2025/11/06 08:05:01")
+
+    assert first == second > 0
+    assert _event_text_to_epoch.cache_info().hits == 1
+    assert coord._coerce_event_timestamp_to_epoch("not a time") == 0.0
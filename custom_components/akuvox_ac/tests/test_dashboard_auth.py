@@ -33,6 +33,57 @@ def test_mobile_dashboard_uses_the_responsive_web_dashboard():
     )
 
 
+def test_dashboard_asset_variants_are_resolved_once():
+    http_module._dashboard_asset_variant.cache_clear()
+    mobile = _dashboard_request({"variant": "mobile"})
+
+    first = http_module._resolve_dashboard_asset("user_overview", mobile)
+    again = http_module._resolve_dashboard_asset("user_overview.html", mobile)
+
+    assert again is first
+    assert http_module._dashboard_asset_variant.cache_info().misses == 1
+
+
+def test_request_prefers_mobile_user_agent_classification():
+    def prefers(agent):
+        return http_module._request_prefers_mobile(_dashboard_request(user_agent=agent))
+
+    assert prefers("Mozilla/5.0 (Linux; Android 14; Pixel 8) Mobile Safari/537.36")
+    assert prefers("Mozilla/5.0 (Linux; Android 13; SM-X200) Safari/537.36")
+    assert prefers("Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X)")
+    assert prefers("Opera/9.80 (J2ME/MIDP; Opera Mini/9.80)")
+    assert not prefers("Mozilla/5.0 (Linux; Android 12; BRAVIA 4K GB ATV3) AndroidTV")
+    assert not prefers("Mozilla/5.0 (Windows NT 10.0; Win64; x64; Android) Chrome/126")
+    assert not prefers("Mozilla/5.0 (X11; Linux x86_64) Firefox/128.0")
+    assert not prefers("")
+
+
+def test_signed_paths_script_placement_ignores_tag_case():
+    head = http_module._inject_signed_paths("<HTML><HEAD><title>x</title></HEAD></HTML>", {})
+    body = http_module._inject_signed_paths('<html><BODY class="ak">Hi</BODY></html>', {})
+
+    assert head.startswith("<HTML><HEAD><title>x</title><script>")
+    assert head.endswith("</script></HEAD></HTML>")
+    assert body.startswith('<html><BODY class="ak"><script>')
+    assert body.endswith("</script>Hi</BODY></html>")
+
+    stray = http_module._inject_signed_paths("<body>x</head>y", {})
+    bare = http_module._inject_signed_paths("plain", {})
+
+    assert stray.startswith("<body>x<script>") and stray.endswith("</script></head>y")
+    assert bare.startswith("<script>") and bare.endswith("</script>plain")
+
+
+def test_cached_insert_offset_matches_fresh_injection():
+    html = "<html><head><title>x</title></head><body>Hi</body></html>"
+    offset = http_module._signed_paths_insert_at(html)
+
+    assert html[offset:].startswith("</head>")
+    assert http_module._inject_signed_paths(
+        html, {"state": "/s"}, insert_at=offset
+    ) == http_module._inject_signed_paths(html, {"state": "/s"})
+
+
 def test_dashboard_injects_signing_helper_without_initial_signed_paths():
     html = "<html><head></head><body>Dashboard</body></html>"
 
@@ -218,3 +269,32 @@ def test_dashboard_frontend_does_not_send_bearer_authorization_headers():
         text = asset.read_text(encoding="utf-8")
         assert "Authorization" not in text, asset.name
         assert "Bearer " not in text, asset.name
+
+
+def test_signed_paths_are_reused_per_refresh_token(monkeypatch):
+    calls = []
+
+    def _sign(hass, path, expiration, *, refresh_token_id):
+        calls.append((path, refresh_token_id))
+        return f"{path}?authSig={refresh_token_id}"
+
+    monkeypatch.setattr(http_module, "async_sign_path", _sign)
+    monkeypatch.setattr(http_module, "_SIGNED_PATHS_CACHE", {})
+    key = http_module.KEY_HASS_REFRESH_TOKEN_ID
+
+    first = http_module._signed_paths_for_request(None, {key: "token-a"})
+    again = http_module._signed_paths_for_request(None, {key: "token-a"})
+    other = http_module._signed_paths_for_request(None, {key: "token-b"})
+
+    assert again is first
+    assert first["state"] == "/api/akuvox_ac/ui/state?authSig=token-a"
+    assert other["state"] == "/api/akuvox_ac/ui/state?authSig=token-b"
+    assert len(calls) == 2 * len(http_module.SIGNED_API_PATHS)
+
+
+def test_now_iso_matches_utc_second_format(monkeypatch):
+    monkeypatch.setattr(http_module, "_NOW_ISO_CACHE", (0, ""))
+    monkeypatch.setattr(http_module.time, "time", lambda: 1718357400.75)
+
+    assert http_module._now_iso() == "2024-06-14T09:30:00Z"
+    assert http_module._now_iso() is http_module._NOW_ISO_CACHE[1]
@@ -8,6 +8,7 @@ from custom_components.akuvox_ac.const import (
     DEFAULT_DEVICE_MODEL,
 )
 from custom_components.akuvox_ac.http import (
+    _any_device_alarm_capable,
     _next_health_check_eta,
     _serialize_devices,
 )
@@ -56,6 +57,20 @@ def test_device_model_falls_back_for_existing_entries():
     assert devices[0]["model"] == DEFAULT_DEVICE_MODEL
 
 
+def test_alarm_capability_matches_serialized_devices():
+    def _root(relay_b):
+        coordinator = SimpleNamespace(
+            device_name="Gate", health={"device_type": "Intercom"}, events=[], users=[]
+        )
+        options = {"relay_roles": {"relay_a": "door", "relay_b": relay_b}}
+        return {"entry-1": {"coordinator": coordinator, "options": options}}
+
+    for relay_b in ("alarm", "none"):
+        assert _any_device_alarm_capable(_root(relay_b)) == _serialize_devices(_root(relay_b))[1]
+    assert _any_device_alarm_capable(_root("alarm")) is True
+    assert _any_device_alarm_capable({}) is False
+
+
 def test_next_health_check_uses_earliest_device_interval():
     first = SimpleNamespace(
         health={"last_health_check": "2026-06-14T09:30:00+00:00"},
@@ -1,5 +1,6 @@
 """Tests for face enrolment status evaluation."""
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -127,6 +128,162 @@ def test_face_status_falls_back_to_pending_when_not_stored_active(monkeypatch):
     assert result == "pending"
 
 
+def test_face_status_uses_precomputed_device_lookups(monkeypatch):
+    """Device group tokens and user indexes can be shared across users."""
+
+    monkeypatch.setattr(http, "_device_face_is_active", lambda record: False)
+
+    hass = _make_hass()
+    user = {"id": "user1", "groups": ["Staff"]}
+    devices = [{"sync_groups": ["Visitors"], "users": [{"id": "user1"}]}]
+
+    assert http._evaluate_face_status(hass, user, devices, "pending") == "active"
+    assert (
+        http._evaluate_face_status(
+            hass, user, devices, "pending", None, [({"staff"}, {"user1": {"id": "user1"}})]
+        )
+        == "pending"
+    )
+    assert http._face_device_lookups(
+        [{"users": [{"UserID": "user1", "n": 1}, {"UserID": "user1", "n": 2}]}]
+    ) == [({"default"}, {"user1": {"UserID": "user1", "n": 1}})]
+
+
+def test_face_status_skips_asset_probe_when_status_is_tracked(monkeypatch):
+    probes = []
+    monkeypatch.setattr(http, "_face_image_exists", lambda hass, user_id: probes.append(user_id))
+
+    hass = _make_hass()
+    assert http._evaluate_face_status(hass, {"id": "user1"}, [], "active") == "active"
+    assert probes == []
+    assert http._evaluate_face_status(hass, {"id": "user1"}, [], "") == "none"
+    assert probes == ["user1"]
+
+
+def test_boolish_values_normalise_across_types():
+    assert http._normalize_boolish(" Enabled ") is True
+    assert http._normalize_boolish("n") is False
+    assert http._normalize_boolish("maybe") is None
+    assert http._normalize_boolish(False) is False
+    assert http._normalize_boolish(2) is True
+    assert http._normalize_boolish(0.0) is False
+    assert http._normalize_boolish(None) is None
+
+
 def test_face_register_status_is_treated_as_face_flag():
     assert http._face_flag_from_record({"FaceRegisterStatus": "1"}) is True
     assert http._face_flag_from_record({"FaceRegisterStatus": "0"}) is False
+
+
+def test_face_storage_dir_resolves_each_directory_once(tmp_path):
+    hass = SimpleNamespace(config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))))
+    http._resolved_dir.cache_clear()
+
+    first = http.face_storage_dir(hass)
+    assert http.face_storage_dir(hass) is first
+    assert first == (tmp_path / http.DOMAIN / "FaceData").resolve()
+    assert http._resolved_dir.cache_info().misses == 1
+
+
+def test_face_and_static_paths_stay_inside_their_roots(tmp_path):
+    assert http._face_candidate(tmp_path, "HA001", "jpg") == tmp_path / "HA001.jpg"
+    assert http._face_candidate(tmp_path, "../HA001", "jpg") is None
+
+    with pytest.raises(http.web.HTTPForbidden):
+        http._static_asset("../http.py")
+    with pytest.raises(http.web.HTTPNotFound):
+        http._static_asset("missing-asset.js")
+
+
+def test_static_asset_lookups_are_cached():
+    http._static_asset.cache_clear()
+
+    first = http._static_asset("index.html")
+
+    assert http._static_asset("index.html") is first
+    assert http._static_asset.cache_info().hits == 1
+
+
+def test_face_route_serves_only_files_inside_face_storage(tmp_path):
+    async def _run(func, *args):
+        return func(*args)
+
+    hass = SimpleNamespace(
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        async_add_executor_job=_run,
+    )
+    face_dir = http.face_storage_dir(hass)
+    face_dir.mkdir(parents=True)
+    (face_dir / "HA001.jpg").write_bytes(b"jpeg")
+    request = SimpleNamespace(app={"hass": hass})
+    view = http.AkuvoxStaticAssets()
+
+    response = asyncio.run(view.get(request, "FaceData/HA001.jpg"))
+
+    assert response["file"] == (face_dir / "HA001.jpg",)
+
+    legacy_dir = http._legacy_face_dir(hass)
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "HA002.jpg").write_bytes(b"old")
+
+    migrated = asyncio.run(view.get(request, "FaceData/HA002.jpg"))
+
+    assert migrated["file"] == (face_dir / "HA002.jpg",)
+    assert (face_dir / "HA002.jpg").read_bytes() == b"old"
+    assert not (legacy_dir / "HA002.jpg").exists()
+    with pytest.raises(http.web.HTTPForbidden):
+        asyncio.run(view.get(request, "FaceData/../secrets.yaml"))
+
+
+def test_face_file_lookup_rescans_only_when_directory_changes(tmp_path, monkeypatch):
+    scans = []
+    real_scandir = http.os.scandir
+
+    def _counting_scandir(path):
+        scans.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(http.os, "scandir", _counting_scandir)
+    (tmp_path / "HA001.jpg").write_bytes(b"x")
+    http.os.utime(tmp_path, ns=(0, 0))
+
+    assert http._face_file_exists_in(tmp_path, "HA001") is True
+    assert http._face_file_exists_in(tmp_path, "HA002") is False
+    assert len(scans) == 1
+
+    (tmp_path / "HA002.png").write_bytes(b"x")
+    http.os.utime(tmp_path, ns=(0, 1))
+    assert http._face_file_exists_in(tmp_path, "HA002") is True
+    assert len(scans) == 2
+    assert http._face_file_exists_in(tmp_path / "missing", "HA001") is False
+
+
+def test_face_file_lookup_rescans_directory_changed_within_same_mtime_tick(tmp_path):
+    tick = http.time.time_ns()
+    (tmp_path / "HA001.jpg").write_bytes(b"x")
+    http.os.utime(tmp_path, ns=(tick, tick))
+
+    assert http._face_file_exists_in(tmp_path, "HA002") is False
+
+    # A coarse mtime leaves the directory timestamp unchanged by this write.
+    (tmp_path / "HA002.jpg").write_bytes(b"x")
+    http.os.utime(tmp_path, ns=(tick, tick))
+
+    assert http._face_file_exists_in(tmp_path, "HA002") is True
+
+
+def test_face_index_lists_face_directories_once(tmp_path, monkeypatch):
+    hass = SimpleNamespace(config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))))
+    face_dir = tmp_path / http.DOMAIN / "FaceData"
+    face_dir.mkdir(parents=True)
+    (face_dir / "HA001.jpg").write_bytes(b"x")
+    (face_dir / "HA002.txt").write_bytes(b"x")
+
+    index = http._build_face_index(hass)
+
+    assert "HA001" in index
+    assert "HA002" not in index
+
+    monkeypatch.setattr(http, "_face_image_exists", lambda hass, user_id: pytest.fail("index not used"))
+    user = {"id": "HA003"}
+    assert http._evaluate_face_status(hass, user, [], stored_status="", face_index=index) == "none"
@@ -19,3 +19,18 @@ def test_normalize_temp_id_returns_padded_canonical_id():
 def test_normalize_user_id_prefers_supported_namespaces():
     assert normalize_user_id("HA7") == "HA007"
     assert normalize_user_id("TMP7") == "TMP007"
+
+
+def test_normalize_ha_id_keeps_canonical_ids_and_rejects_lookalikes():
+    assert normalize_ha_id("HA000") == "HA000"
+    assert normalize_ha_id("HA-12") == "HA012"
+    assert normalize_ha_id("ha012") == "HA012"
+    assert normalize_ha_id(" HA01") == "HA001"
+    assert normalize_ha_id("HA01x") is None
+
+
+def test_normalize_ha_id_rejects_non_decimal_digit_suffixes():
+    assert normalize_ha_id("HA1²3") is None
+    assert normalize_temp_id("TMP²") is None
+    assert normalize_ha_id("HA-") is None
+    assert normalize_temp_id(" tmp-007 ") == "TMP007"
@@ -9,7 +9,11 @@ from custom_components.akuvox_ac.const import (  # noqa: E402
     DOMAIN,
     INBOUND_CALL_RESULT_DENIED,
 )
-from custom_components.akuvox_ac.http import _process_inbound_call_webhook  # noqa: E402
+from custom_components.akuvox_ac.http import (  # noqa: E402
+    _build_phone_index,
+    _match_user_by_number,
+    _process_inbound_call_webhook,
+)
 
 
 class _CallApiStub:
@@ -69,3 +73,69 @@ def test_unknown_inbound_call_uses_any_denied_notification_rule():
     assert kwargs["user_id"] == "07920671814"
     assert kwargs["summary"] == "Inbound call - access Denied (07920671814)"
     assert kwargs["extra"]["event"]["CallNumber"] == "07920671814"
+
+
+def test_phone_index_is_reused_until_users_store_revision_changes():
+    class _UsersStore:
+        def __init__(self):
+            self.revision = 1
+            self.users = {"HA001": {"name": "Sam", "phone": "07920 671814", "key_holder": True}}
+            self.all_calls = 0
+
+        def all(self):
+            self.all_calls += 1
+            return dict(self.users)
+
+    store = _UsersStore()
+    root = {"users_store": store}
+
+    first = _build_phone_index(root)
+    assert _build_phone_index(root) is first
+    assert store.all_calls == 1
+    assert root["phone_index"][2] is first
+
+    other_root = {"users_store": _UsersStore()}
+    assert _build_phone_index(other_root) is not first
+    assert _match_user_by_number("07920671814", first)["ha_id"] == "HA001"
+
+    store.users["HA002"] = {"name": "Alex", "phone": "01234 567890"}
+    store.revision = 2
+
+    rebuilt = _build_phone_index(root)
+    assert store.all_calls == 2
+    assert _match_user_by_number("01234567890", rebuilt)["ha_id"] == "HA002"
+
+
+def test_known_inbound_call_payload_does_not_share_cached_profile():
+    class _RecentCallApi:
+        async def call_log(self):
+            return [
+                {
+                    "ID": "call-2",
+                    "Type": "received",
+                    "Number": "07920671814",
+                    "Timestamp": (dt.datetime.now() - dt.timedelta(seconds=5)).isoformat(),
+                }
+            ]
+
+    class _UsersStore:
+        revision = 1
+
+        def all(self):
+            return {"HA001": {"name": "Sam", "phone": "07920671814", "key_holder": True}}
+
+    bus = _BusStub()
+    root = {
+        "device-1": {"api": _RecentCallApi(), "coordinator": _CoordinatorStub()},
+        "users_store": _UsersStore(),
+    }
+    hass = type("Hass", (), {"data": {DOMAIN: root}, "bus": bus})()
+
+    asyncio.run(_process_inbound_call_webhook(hass))
+    first_profile = bus.events[0][1]["user_profile"]
+    first_profile["name"] = "Changed by a listener"
+
+    asyncio.run(_process_inbound_call_webhook(hass))
+
+    assert bus.events[1][1]["user_profile"]["name"] == "Sam"
+    assert root["phone_index"][2][0]["profile"]["name"] == "Sam"
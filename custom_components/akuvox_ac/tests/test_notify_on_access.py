@@ -104,6 +104,18 @@ def test_settings_store_targets_user_profile_change_alerts():
     ]
 
 
+def test_settings_store_skips_sanitising_when_no_alert_targets():
+    store = _settings_store({})
+
+    def _unexpected():
+        raise AssertionError("empty alert targets should not be sanitised")
+
+    store.get_alert_targets = _unexpected
+
+    assert store.targets_for_event("any_denied") == []
+    assert store.targets_for_event("user_granted", user_id="HA012") == []
+
+
 def test_settings_store_tracks_expiry_reminder_sent_date():
     store = _settings_store({})
 
@@ -1,8 +1,11 @@
+import asyncio
+
 from custom_components.akuvox_ac.ha_test_stubs import ensure_homeassistant_stubs
 
 ensure_homeassistant_stubs()
 
 from custom_components.akuvox_ac.integration import (  # noqa: E402
+    AkuvoxUsersStore,
     _is_obsolete_akuvox_entity,
     _is_legacy_integration_device,
 )
@@ -144,3 +147,71 @@ def test_obsolete_akuvox_entity_requires_akuvox_platform_and_entry():
     )
 
     assert _is_obsolete_akuvox_entity(entity, "entry-1") is False
+
+
+def test_next_free_ids_fill_the_lowest_gap():
+    store = object.__new__(AkuvoxUsersStore)
+    store.data = {
+        "users": {
+            "HA001": {},
+            "HA002": {"status": "deleted"},
+            "HA003": {},
+            "TMP001": {},
+        }
+    }
+
+    assert store.next_free_ha_id() == "HA002"
+    assert store.next_free_ha_id(blocked=["ha-2", "HA4"]) == "HA005"
+    assert store.next_free_temp_id() == "TMP002"
+
+
+def test_upsert_profiles_saves_once_for_many_updates():
+    store = object.__new__(AkuvoxUsersStore)
+    store.data = {"users": {"HA001": {"face_status": "pending"}}}
+    saves = []
+
+    async def _save():
+        saves.append(dict(store.data["users"]))
+
+    store.async_save = _save
+
+    asyncio.run(
+        store.upsert_profiles(
+            [
+                ("HA001", {"face_status": "active", "face_synced_at": "2024-01-01"}),
+                ("ha-2", {"face_status": "error"}),
+            ]
+        )
+    )
+    asyncio.run(store.upsert_profiles([]))
+
+    assert len(saves) == 1
+    assert saves[0]["HA001"]["face_status"] == "active"
+    assert saves[0]["HA002"]["face_status"] == "error"
+
+
+def test_upsert_profiles_skips_failing_entry_and_saves_the_rest():
+    store = object.__new__(AkuvoxUsersStore)
+    store.data = {"users": {"HA001": {"face_status": "pending"}}}
+    saves = []
+
+    async def _save():
+        saves.append(dict(store.data["users"]))
+
+    store.async_save = _save
+
+    applied = asyncio.run(
+        store.upsert_profiles(
+            [
+                ("HA001", {"face_status": "active"}),
+                ("HA002", {"not_a_profile_field": True}),
+                ("HA003", {"face_status": "error"}),
+            ]
+        )
+    )
+
+    assert applied == ["HA001", "HA003"]
+    assert len(saves) == 1
+    assert saves[0]["HA001"]["face_status"] == "active"
+    assert saves[0]["HA003"]["face_status"] == "error"
+    assert "HA002" not in saves[0]